@@ -1,14 +1,23 @@
 import json
+import asyncio
 import httpx
 import os
 from dotenv import load_dotenv
-from agent.tool_function import calculateFunc, scrapWeatherFunc, crawlSubjectFunc
-from agent.tool import tools, tool_functions
+from agent.tool import tools, tool_functions, tool_cache
+from agent.tool_cache import ToolFailure
+from agent.history import HistoryManager
+from agent.console import AsyncConsole
+from crawler.client import HttpClients, default_clients, set_default_clients
 import inspect
+import time
+from collections import deque
 
 class AIAgent:
-    def __init__(self, url: str):
+    def __init__(self, url: str, clients: HttpClients = None, max_parallel_tools: int = 4, tool_timeout: float = 60.0, stream: bool = False, context_budget: int = 3000):
         self.url = url
+        # one pooled client set for the LLM calls and every tool
+        self.clients = clients or default_clients()
+        set_default_clients(self.clients)
         self.payload = {
             "model": "lmstudio-community/DeepSeek-R1-Distill-Qwen-7B-GGUF",
             "messages": [
@@ -19,7 +28,12 @@ class AIAgent:
             "tools": self.define_tools(),
             "tool-chain": "none"
         }
-        self.executed_calls = set()
+        self.tool_semaphore = asyncio.Semaphore(max_parallel_tools)
+        self.tool_timeout = tool_timeout
+        self.stream = stream
+        self.history = HistoryManager(budget=context_budget)
+        self.tool_trace = deque(maxlen=200)  # recent tool calls, read by the batch runner
+        self.llm_timeout = httpx.Timeout(connect=1000.0, read=120000.0, write=100000.0, pool=50000000.0)
 
     def system_prompt(self):
         return (
@@ -27,6 +41,7 @@ class AIAgent:
             "- Math: use `calculateFunc`\n"
             "- Weather: use `scrapWeatherFunc`\n"
             "- Public topics, events, people, or anything Wikipedia-related: use `crawlSubjectFunc`\n"
+            "- Products and prices from an eMAG listing url: use `scrapeProductsFunc`\n"
             "- ONLY CALL THE FUNCTION 1 TIME"
             "\n"
             "- ONLY CALL A TOOL ONCE with the same input. If you've already called it with specific arguments, do not call it again.\n"
@@ -52,58 +67,157 @@ class AIAgent:
     def define_tools(self):
         return list(tools.values())
 
-    async def chat(self):
-        timeout = httpx.Timeout(connect=1000.0, read=120000.0, write=100000.0, pool=50000000.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            while True:
-                user_input = input("User: ")
-                if user_input.lower() in ['exit', 'quit']:
+    async def run_tool(self, tool_name: str, args: dict) -> str:
+        try:
+            # the first call imports the tool's module, which may miss a dependency
+            func = tool_functions.get(tool_name)
+        except Exception as e:
+            return ToolFailure(f"Error: {tool_name} unavailable: {e}")
+        if not func:
+            return f"Unknown tool: {tool_name}"
+        started = time.perf_counter()
+        # repeated calls are answered from the cache instead of being dropped
+        result = await tool_cache.call(tool_name, args, lambda: self.invoke_tool(func, tool_name, args))
+        self.tool_trace.append({
+            "tool": tool_name,
+            "args": args,
+            "seconds": round(time.perf_counter() - started, 4),
+            "result": result
+        })
+        return result
+
+    async def invoke_tool(self, func, tool_name: str, args: dict) -> str:
+        async with self.tool_semaphore:
+            try:
+                if inspect.iscoroutinefunction(func):
+                    call = func(**args)
+                else:
+                    # sync tools (calculateFunc) run in a thread; a thread doesn't help against
+                    # GIL-bound work, so the calculator itself keeps every single call cheap
+                    call = asyncio.to_thread(func, **args)
+                return await asyncio.wait_for(call, timeout=self.tool_timeout)
+            except asyncio.TimeoutError:
+                return ToolFailure(f"Error: {tool_name} timed out after {self.tool_timeout}s")
+            except Exception as e:
+                return ToolFailure(f"Error: {e}")
+
+    async def tool_error(self, message: str) -> str:
+        return ToolFailure(message)
+
+    def start_tool(self, call: dict):
+        try:
+            args = json.loads(call["function"]["arguments"])
+        except json.JSONDecodeError:
+            return None  # chat() reports the bad arguments when it reaches this call
+        return asyncio.create_task(self.run_tool(call["function"]["name"], args))
+
+    async def request_message(self, client: httpx.AsyncClient, timeout: httpx.Timeout):
+        """
+        Ask the model for its next message. Returns the message and the tool calls
+        already started while streaming, keyed by their position in tool_calls.
+        """
+        # the history is trimmed in place so it stays bounded, not just the request
+        self.payload["messages"] = self.history.trim(self.payload["messages"])
+
+        if not self.stream:
+            res = await client.post(self.url, json=self.payload, timeout=timeout)
+            return res.json()["choices"][0]["message"], {}
+
+        content = []
+        calls = []
+        started = {}
+        async with client.stream("POST", self.url, json={**self.payload, "stream": True}, timeout=timeout) as res:
+            async for line in res.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
                     break
+                choices = json.loads(data).get("choices") or [{}]
+                delta = choices[0].get("delta", {})
+
+                if delta.get("content"):
+                    if not content:
+                        print("Model: ", end="")
+                    print(delta["content"], end="", flush=True)
+                    content.append(delta["content"])
+
+                for part in delta.get("tool_calls") or []:
+                    index = part.get("index", len(calls) - 1 if calls else 0)
+                    while len(calls) <= index:
+                        calls.append({"id": "", "type": "function", "function": {"name": "", "arguments": ""}})
+                        # a new call starting means every earlier one has all its arguments
+                        for done in range(len(calls) - 1):
+                            if done not in started:
+                                started[done] = self.start_tool(calls[done])
+                    call = calls[index]
+                    call["id"] = part.get("id") or call["id"]
+                    function = part.get("function") or {}
+                    call["function"]["name"] += function.get("name") or ""
+                    call["function"]["arguments"] += function.get("arguments") or ""
+
+        for index, call in enumerate(calls):
+            if index not in started:
+                started[index] = self.start_tool(call)
+        if content:
+            print()
+
+        message = {"role": "assistant", "content": "".join(content)}
+        if calls:
+            message["tool_calls"] = calls
+        return message, {index: task for index, task in started.items() if task is not None}
+
+    async def ask(self, user_input: str) -> str:
+        """Run one user turn, including any tool calls, and return the model's final answer."""
+        client = self.clients.httpx
+        self.payload["messages"].append({"role": "user", "content": user_input})
+        message, started = await self.request_message(client, self.llm_timeout)
+        self.payload["messages"].append(message)
+
+        while "tool_calls" in message:
+            pending = []
+            for index, call in enumerate(message["tool_calls"]):
+                tool_name = call["function"]["name"]
+                raw_args = call["function"]["arguments"]
+
+                try:
+                    args = json.loads(raw_args)
+                except json.JSONDecodeError as e:
+                    print(f"[ERROR] JSON decode error: {e}")
+                    # every tool_call_id needs a tool message, or the next request is rejected
+                    pending.append((call, tool_name, self.tool_error(f"Error: invalid JSON arguments: {e}")))
+                    continue
+
+                task = started.get(index)
+                pending.append((call, tool_name, task if task is not None else self.run_tool(tool_name, args)))
+
+            # calls from one message run concurrently; tool messages keep the original order
+            results = await asyncio.gather(*(result for _, _, result in pending))
+            tool_messages = [
+                {
+                    "role": "tool",
+                    "tool_call_id": call["id"],
+                    "name": tool_name,
+                    "content": result
+                }
+                for (call, tool_name, _), result in zip(pending, results)
+            ]
+
+            self.payload["messages"].extend(tool_messages)
+            message, started = await self.request_message(client, self.llm_timeout)
+            self.payload["messages"].append(message)
+
+        if "content" not in message:
+            print("[WARN] No 'content' or 'tool_calls' in message:", message)
+        return message.get("content") or ""
+
+    async def chat(self):
+        console = AsyncConsole()
+        while True:
+            user_input = await console.readline("User: ")
+            if user_input is None or user_input.lower() in ['exit', 'quit']:
+                break
 
-                self.payload["messages"].append({"role": "user", "content": user_input})
-                res = await client.post(self.url, json=self.payload)
-                message = res.json()["choices"][0]["message"]
-
-                while "tool_calls" in message:
-                    tool_messages = []
-                    for call in message["tool_calls"]:
-                        tool_name = call["function"]["name"]
-                        raw_args = call["function"]["arguments"]
-
-                        try:
-                            args = json.loads(raw_args)
-                        except json.JSONDecodeError as e:
-                            print(f"[ERROR] JSON decode error: {e}")
-                            continue
-
-                        call_key = (tool_name, json.dumps(args, sort_keys=True))
-                        if call_key in self.executed_calls:
-                            print(f"[SKIP] Duplicate tool call: {tool_name} with same arguments")
-                            continue
-
-                        self.executed_calls.add(call_key)
-
-                        func = tool_functions.get(tool_name)
-                        if not func:
-                            result = f"Unknown tool: {tool_name}"
-                        elif inspect.iscoroutinefunction(func):
-                            result = await func(**args)
-                        else:
-                            result = func(**args)
-
-                        tool_messages.append({
-                            "role": "tool",
-                            "tool_call_id": call["id"],
-                            "name": tool_name,
-                            "content": result
-                        })
-
-                    self.payload["messages"].extend(tool_messages)
-                    follow_up = await client.post(self.url, json=self.payload)
-                    message = follow_up.json()["choices"][0]["message"]
-                    self.payload["messages"].append(message)
-
-                if "content" in message:
-                    print("Model:", message["content"])
-                elif "tool_calls" not in message:
-                    print("[WARN] No 'content' or 'tool_calls' in message:", message)
+            answer = await self.ask(user_input)
+            if not self.stream:  # streamed content was printed as it arrived
+                print("Model:", answer)
@@ -0,0 +1,169 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from typing import List
+from dotenv import load_dotenv
+from agent.agent import AIAgent
+from agent.tool import tool_cache
+from crawler.client import HttpClients
+from crawler.browserPool import close_default_pool
+from crawler.parsePool import close_parse_pools
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile: p50 of 1..10 is 5, p95 of 1..20 is 19."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def load_prompts(path: str) -> List[dict]:
+    prompts = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                # kept as a failed item so the output still has one line per input line
+                prompts.append({"id": number, "raw": line, "invalid": f"Invalid JSON: {e}"})
+                continue
+            if isinstance(record, str):
+                record = {"prompt": record}
+            elif not isinstance(record, dict):
+                record = {}
+            record.setdefault("id", number)
+            prompts.append(record)
+    return prompts
+
+
+async def run_batch(llm_url: str, clients: HttpClients, input_path: str, output_path: str, concurrency: int = 4,
+                    use_tool_cache: bool = True) -> dict:
+    """
+    Run every prompt of a JSONL file through its own AIAgent session, at most
+    `concurrency` at a time, appending one result line per prompt as soon as it
+    finishes. Returns the throughput report.
+
+    The shared tool cache is cleared first so results from earlier runs don't
+    skew latencies; with `use_tool_cache=False` every tool call really runs.
+    """
+    prompts = load_prompts(input_path)
+    tool_cache.clear()
+    cache_was_enabled = tool_cache.enabled
+    tool_cache.enabled = use_tool_cache
+    queue = asyncio.Queue()
+    for record in prompts:
+        queue.put_nowait(record)
+
+    latencies = []
+    tool_seconds = defaultdict(float)
+    tool_calls = defaultdict(int)
+    failures = 0
+
+    with open(output_path, "w", encoding="utf-8") as out:
+
+        async def worker():
+            nonlocal failures
+            while not queue.empty():
+                record = queue.get_nowait()
+                prompt = record.get("prompt")
+                if "invalid" in record or not isinstance(prompt, str) or not prompt.strip():
+                    failures += 1
+                    result = {
+                        "id": record["id"],
+                        "prompt": prompt,
+                        "response": None,
+                        "error": record.get("invalid", "Missing 'prompt'"),
+                        "seconds": 0.0,
+                        "tools": []
+                    }
+                    if "invalid" in record:
+                        result["raw"] = record["raw"]
+                    out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                    out.flush()
+                    continue
+                agent = AIAgent(llm_url, clients=clients)
+                started = time.perf_counter()
+                response, error = None, None
+                try:
+                    response = await agent.ask(prompt)
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    failures += 1
+                elapsed = time.perf_counter() - started
+                latencies.append(elapsed)
+
+                trace = list(agent.tool_trace)
+                for entry in trace:
+                    tool_seconds[entry["tool"]] += entry["seconds"]
+                    tool_calls[entry["tool"]] += 1
+
+                out.write(json.dumps({
+                    "id": record["id"],
+                    "prompt": prompt,
+                    "response": response,
+                    "error": error,
+                    "seconds": round(elapsed, 4),
+                    "tools": trace
+                }, ensure_ascii=False) + "\n")
+                out.flush()
+
+        batch_started = time.perf_counter()
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        finally:
+            tool_cache.enabled = cache_was_enabled
+        wall = time.perf_counter() - batch_started
+
+    return {
+        "prompts": len(prompts),
+        "failures": failures,
+        "seconds": round(wall, 3),
+        "prompts_per_second": round(len(prompts) / wall, 3) if wall else 0.0,
+        "p50_latency": round(percentile(latencies, 50), 3),
+        "p95_latency": round(percentile(latencies, 95), 3),
+        "tool_cache": {"enabled": use_tool_cache, "hits": tool_cache.hits, "misses": tool_cache.misses},
+        "tools": {
+            name: {"calls": tool_calls[name], "seconds": round(tool_seconds[name], 3)}
+            for name in sorted(tool_calls)
+        }
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"Prompts: {report['prompts']} ({report['failures']} failed) in {report['seconds']}s")
+    print(f"Throughput: {report['prompts_per_second']} prompts/s")
+    print(f"Latency: p50 {report['p50_latency']}s, p95 {report['p95_latency']}s")
+    cache = report["tool_cache"]
+    print(f"Tool cache: {'on' if cache['enabled'] else 'off'}, {cache['hits']} hits, {cache['misses']} misses")
+    for name, stats in report["tools"].items():
+        print(f"  {name}: {stats['calls']} calls, {stats['seconds']}s")
+
+
+async def main(args):
+    async with HttpClients() as clients:
+        try:
+            report = await run_batch(os.getenv("API_LM_KEY"), clients, args.input, args.output, args.concurrency,
+                                 use_tool_cache=not args.no_tool_cache)
+        finally:
+            await close_default_pool()
+            close_parse_pools()
+    print_report(report)
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Run a JSONL file of prompts through the agent.")
+    parser.add_argument("input", help="JSONL file, one {\"prompt\": ...} per line")
+    parser.add_argument("output", help="JSONL file for responses and tool traces")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--no-tool-cache", action="store_true", help="run every tool call instead of reusing cached results")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,311 @@
+import ast
+import json
+import math
+import operator
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+MAX_EXPRESSION_LENGTH = 1000
+MAX_NODES = 200
+MAX_INT_BITS = 4096          # ~1233 decimal digits
+MAX_ROUND_DIGITS = 100       # round(7, -10**7) would build 10**(10**7) in one C call
+DEFAULT_TIMEOUT = 0.5        # seconds; only checked between nodes, so every
+                             # single function call must be cheap on its own
+MAX_POINTS = 10000           # values per batched call
+
+
+class CalculationError(ValueError):
+    pass
+
+
+def _checked_int(value):
+    if isinstance(value, int) and value.bit_length() > MAX_INT_BITS:
+        raise CalculationError("Result is too large")
+    return value
+
+
+def _pow(base, exponent):
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0 and abs(base) > 1:
+        # estimate the size of the result before computing it
+        if exponent * math.log2(abs(base)) > MAX_INT_BITS:
+            raise CalculationError("Exponent is too large")
+    result = base ** exponent
+    if isinstance(result, complex):
+        # (-8) ** (1/3) is complex in Python; the calculator only deals in reals
+        raise CalculationError("Result is not a real number")
+    return result
+
+
+def _mul(left, right):
+    if isinstance(left, int) and isinstance(right, int):
+        if left.bit_length() + right.bit_length() > MAX_INT_BITS:
+            raise CalculationError("Result is too large")
+    return left * right
+
+
+def _max_factorial(bits: int) -> int:
+    """Largest n whose factorial still fits in `bits` bits."""
+    n, size = 0, 0.0
+    while size + math.log2(n + 1) <= bits:
+        n += 1
+        size += math.log2(n)
+    return n
+
+
+MAX_FACTORIAL = _max_factorial(MAX_INT_BITS)   # 536 for 4096 bits
+
+
+def _round(number, ndigits=None):
+    if ndigits is None:
+        return round(number)
+    if isinstance(ndigits, bool) or not isinstance(ndigits, int):
+        raise CalculationError("round() needs a whole number of digits")
+    if abs(ndigits) > MAX_ROUND_DIGITS:
+        raise CalculationError(f"round() accepts at most {MAX_ROUND_DIGITS} digits")
+    return round(number, ndigits)
+
+
+def _factorial(n):
+    if not isinstance(n, int) or n > MAX_FACTORIAL:
+        raise CalculationError(f"factorial() only accepts integers up to {MAX_FACTORIAL}")
+    return math.factorial(n)
+
+
+BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: _mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: _pow,
+}
+
+UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+FUNCTIONS = {
+    "abs": abs, "round": _round, "min": min, "max": max,
+    "sqrt": math.sqrt, "exp": math.exp, "log": math.log, "log10": math.log10, "log2": math.log2,
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan, "atan2": math.atan2,
+    "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+    "degrees": math.degrees, "radians": math.radians, "hypot": math.hypot,
+    "floor": math.floor, "ceil": math.ceil, "gcd": math.gcd, "factorial": _factorial,
+}
+
+# array versions used when a whole range is evaluated at once; expressions using
+# anything else (factorial, gcd, min/max with more than two args) fall back to a loop
+VECTOR_FUNCTIONS = {
+    "abs": np.abs, "round": np.round, "min": np.minimum, "max": np.maximum,
+    "sqrt": np.sqrt, "exp": np.exp, "log": np.log, "log10": np.log10, "log2": np.log2,
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan, "atan2": np.arctan2,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "degrees": np.degrees, "radians": np.radians, "hypot": np.hypot,
+    "floor": np.floor, "ceil": np.ceil,
+} if np is not None else {}
+
+CONSTANTS = {
+    "pi": math.pi,
+    "e": math.e,
+    "tau": math.tau,
+}
+
+# compiled nodes take (variables, deadline)
+Compiled = Callable[[Dict[str, float], float], float]
+
+
+def _check_deadline(deadline: float) -> None:
+    if time.perf_counter() > deadline:
+        raise CalculationError("Calculation took too long")
+
+
+def _compile(node: ast.AST, variables: frozenset, functions: dict = FUNCTIONS) -> Compiled:
+    if isinstance(node, ast.Expression):
+        return _compile(node.body, variables, functions)
+
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise CalculationError(f"Unsupported constant: {value!r}")
+        _checked_int(value)
+        return lambda env, deadline: value
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name in variables:
+            return lambda env, deadline: env[name]
+        if name in CONSTANTS:
+            value = CONSTANTS[name]
+            return lambda env, deadline: value
+        raise CalculationError(f"Unknown name: {name}")
+
+    if isinstance(node, ast.BinOp):
+        op = BINARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise CalculationError(f"Unsupported operator: {type(node.op).__name__}")
+        left = _compile(node.left, variables, functions)
+        right = _compile(node.right, variables, functions)
+
+        def binary(env, deadline):
+            _check_deadline(deadline)
+            return _checked_int(op(left(env, deadline), right(env, deadline)))
+        return binary
+
+    if isinstance(node, ast.UnaryOp):
+        op = UNARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise CalculationError(f"Unsupported operator: {type(node.op).__name__}")
+        operand = _compile(node.operand, variables, functions)
+        return lambda env, deadline: op(operand(env, deadline))
+
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in functions or node.keywords:
+            raise CalculationError(f"Unsupported function: {ast.unparse(node.func)}")
+        func = functions[node.func.id]
+        if hasattr(func, "nin") and len(node.args) != func.nin:
+            # a NumPy ufunc would read an extra argument as its `out` array
+            raise CalculationError(f"{node.func.id}() takes {func.nin} arguments here")
+        args = [_compile(arg, variables, functions) for arg in node.args]
+
+        def call(env, deadline):
+            _check_deadline(deadline)
+            return _checked_int(func(*(arg(env, deadline) for arg in args)))
+        return call
+
+    raise CalculationError(f"Unsupported syntax: {type(node).__name__}")
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str, variables: frozenset = frozenset(), vectorized: bool = False) -> Compiled:
+    """Parse and validate an expression once; the result is cached by its text."""
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise CalculationError("Expression is too long")
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise CalculationError(f"Invalid expression: {e.msg}") from None
+    if sum(1 for _ in ast.walk(tree)) > MAX_NODES:
+        raise CalculationError("Expression is too complex")
+    return _compile(tree, variables, VECTOR_FUNCTIONS if vectorized else FUNCTIONS)
+
+
+def evaluate(expression: str, variables: Optional[Dict[str, float]] = None, timeout: float = DEFAULT_TIMEOUT):
+    """
+    Evaluate an arithmetic expression without eval(): only numbers, + - * / // % **,
+    the math functions in FUNCTIONS and the given variables are allowed, integer
+    results are capped at MAX_INT_BITS and evaluation stops after `timeout` seconds.
+    """
+    variables = variables or {}
+    compiled = compile_expression(expression, frozenset(variables))
+    try:
+        return compiled(variables, time.perf_counter() + timeout)
+    except CalculationError:
+        raise
+    except (ArithmeticError, ValueError, TypeError) as e:
+        raise CalculationError(str(e)) from None
+
+
+def evaluate_many(expressions: List[str], timeout: float = DEFAULT_TIMEOUT) -> List:
+    """Evaluate a list of expressions; a failing one yields its CalculationError instead of a value."""
+    if len(expressions) > MAX_POINTS:
+        raise CalculationError(f"At most {MAX_POINTS} expressions per call")
+    deadline = time.perf_counter() + timeout
+    results = []
+    for expression in expressions:
+        try:
+            results.append(evaluate(expression, timeout=max(0.0, deadline - time.perf_counter())))
+        except CalculationError as e:
+            results.append(e)
+    return results
+
+
+def range_values(start: float, stop: float, step: float = 1) -> List[float]:
+    """Values from start to stop inclusive."""
+    if step == 0 or (stop - start) / step < 0:
+        raise CalculationError("step must move from start towards stop")
+    count = int(math.floor((stop - start) / step + 1e-9)) + 1
+    if count > MAX_POINTS:
+        raise CalculationError(f"At most {MAX_POINTS} values per call")
+    return [start + i * step for i in range(count)]
+
+
+def evaluate_range(expression: str, variable: str, start: float, stop: float, step: float = 1, timeout: float = DEFAULT_TIMEOUT) -> List:
+    """
+    Evaluate expression for every value of `variable` from start to stop. With
+    NumPy installed the whole range is computed in one vectorized pass unless a
+    result would lose precision in float64; values that fail come back as None.
+    """
+    values = range_values(start, stop, step)
+    deadline = time.perf_counter() + timeout
+    names = frozenset([variable])
+
+    if np is not None:
+        try:
+            compiled = compile_expression(expression, names, vectorized=True)
+        except CalculationError:
+            compiled = None  # uses something only the scalar functions support
+        if compiled is not None:
+            try:
+                with np.errstate(all="ignore"):
+                    array = np.broadcast_to(compiled({variable: np.asarray(values, dtype=float)}, deadline), (len(values),))
+                # float64 rounds above 2**53 and overflows to inf where exact ints wouldn't;
+                # only trust the array when every value is finite and below that
+                if np.all(np.isfinite(array)) and np.all(np.abs(array) < 2 ** 53):
+                    return [_plain(value) for value in array.tolist()]
+            except (ArithmeticError, ValueError, TypeError):
+                pass  # retry value by value below
+
+    compiled = compile_expression(expression, names)
+    results = []
+    for value in values:
+        try:
+            results.append(_plain(compiled({variable: _plain(value)}, deadline)))
+        except CalculationError as e:
+            if "too long" in str(e):
+                raise
+            results.append(None)
+        except (ArithmeticError, ValueError, TypeError):
+            results.append(None)
+    return results
+
+
+def _plain(value):
+    """Turn floats that hold whole numbers back into ints and nan/inf/complex into None."""
+    if isinstance(value, complex):
+        return None
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return None
+        if value.is_integer() and abs(value) < 2 ** 53:
+            return int(value)
+    return value
+
+
+def calculateFunc(expression: str = "", expressions: Optional[list] = None, variable: Optional[str] = None,
+                  start: Optional[float] = None, stop: Optional[float] = None, step: float = 1) -> str:
+    try:
+        if expressions:
+            results = evaluate_many([str(item) for item in expressions])
+            return "\n".join(
+                f"{item} = {f'Error: {result}' if isinstance(result, Exception) else result}"
+                for item, result in zip(expressions, results)
+            )
+        if variable and start is not None and stop is not None:
+            # one call for a whole table, e.g. expression="n**2", variable="n", start=1, stop=1000
+            results = evaluate_range(expression, variable, float(start), float(stop), float(step))
+            return f"{expression} for {variable} = {start}..{stop} step {step}: {json.dumps(results)}"
+        result = evaluate(expression)
+        return str(result)
+    except Exception as e:
+        return f"Error: {e}"
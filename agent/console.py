@@ -0,0 +1,45 @@
+import asyncio
+import sys
+from typing import Optional
+
+
+class AsyncConsole:
+    """
+    Reads stdin lines without blocking the event loop, so background tasks
+    (streamed output, running tools, the server) keep going while the user types.
+
+    Piped stdin is read through the event loop. A terminal is read in a thread
+    instead: connect_read_pipe would make the tty non-blocking, and stdout shares
+    it, so large prints could fail with BlockingIOError.
+    """
+
+    def __init__(self) -> None:
+        self.__reader: Optional[asyncio.StreamReader] = None
+
+    async def __get_reader(self) -> Optional[asyncio.StreamReader]:
+        if self.__reader is None:
+            if sys.stdin.isatty():
+                return None
+            loop = asyncio.get_running_loop()
+            reader = asyncio.StreamReader()
+            try:
+                await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+            except (NotImplementedError, ValueError, OSError):
+                return None  # e.g. Windows consoles: fall back to a thread
+            self.__reader = reader
+        return self.__reader
+
+    async def readline(self, prompt: str = "") -> Optional[str]:
+        """Returns None at end of input."""
+        print(prompt, end="", flush=True)
+        reader = await self.__get_reader()
+        if reader is None:
+            try:
+                return await asyncio.to_thread(input)
+            except EOFError:
+                return None
+
+        line = await reader.readline()
+        if not line:
+            return None
+        return line.decode(errors="replace").rstrip("\r\n")
@@ -0,0 +1,60 @@
+import json
+from typing import List
+
+
+TRUNCATED = " …[truncated]"
+
+
+def estimate_tokens(message: dict) -> int:
+    """Rough token count (~4 characters per token) plus a small per-message overhead."""
+    size = len(message.get("content") or "")
+    for call in message.get("tool_calls") or []:
+        size += len(json.dumps(call))
+    return size // 4 + 4
+
+
+class HistoryManager:
+    """
+    Keeps the conversation sent to the model under a token budget.
+
+    The system prompt and the latest turn are always kept. Tool outputs from
+    older turns are cut down to old_tool_chars, and if the history is still
+    over budget the oldest turns are dropped whole, so an assistant tool call
+    never loses the tool messages that answer it.
+    """
+
+    def __init__(self, budget: int = 3000, old_tool_chars: int = 400) -> None:
+        self.budget = budget
+        self.old_tool_chars = old_tool_chars
+
+    def split_turns(self, messages: List[dict]) -> List[List[dict]]:
+        turns = []
+        for message in messages:
+            if message.get("role") == "user" or not turns:
+                turns.append([])
+            turns[-1].append(message)
+        return turns
+
+    def shrink(self, message: dict) -> dict:
+        content = message.get("content") or ""
+        if message.get("role") != "tool" or len(content) <= self.old_tool_chars:
+            return message
+        return {**message, "content": content[:self.old_tool_chars] + TRUNCATED}
+
+    def trim(self, messages: List[dict]) -> List[dict]:
+        head = messages[:1] if messages and messages[0].get("role") == "system" else []
+        turns = self.split_turns(messages[len(head):])
+        if not turns:
+            return list(messages)
+
+        turns = [[self.shrink(message) for message in turn] for turn in turns[:-1]] + [turns[-1]]
+
+        used = sum(estimate_tokens(message) for message in head)
+        sizes = [sum(estimate_tokens(message) for message in turn) for turn in turns]
+        total = used + sum(sizes)
+        first = 0
+        while total > self.budget and first < len(turns) - 1:
+            total -= sizes[first]
+            first += 1
+
+        return head + [message for turn in turns[first:] for message in turn]
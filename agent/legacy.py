@@ -0,0 +1,222 @@
+import httpx
+import json
+import asyncio
+import os
+from dotenv import load_dotenv
+from crawler.crawler import Crawler
+from agent.calculator import evaluate
+from agent.tool_function import find_wikipedia_page, fetch_wikipedia_seed, scrapWeatherFunc
+from crawler.client import HttpClients, default_clients, set_default_clients
+
+class AIAgent:
+    def __init__(self, url: str, clients: HttpClients = None):
+        self.url = url
+        self.clients = clients or default_clients()
+        set_default_clients(self.clients)
+        self.payload = {
+            "model": "lmstudio-community/DeepSeek-R1-Distill-Qwen-7B-GGUF",
+            "messages": [
+                {"role": "system", "content": self.system_prompt()}
+            ],
+            "temperature": 0.6,
+            "max_tokens": 1024,
+            "tools": self.define_tools(),
+            "tool-chain": "auto"
+        }
+        self.executed_calls = set()
+
+
+    def system_prompt(self):
+        return (
+            "You are a helpful and strict AI agent.\n"
+            "\n"
+            "Your job is to always use available tools to answer questions about:\n"
+            "- Math: use `calculateFunc`\n"
+            "- Weather: use `scrapWeatherFunc`\n"
+            "- Public topics, events, people, or anything Wikipedia-related: use `crawlSubjectFunc`\n"
+            "\n"
+            "YOU MUST NOT try to answer yourself when a tool exists.\n"
+            "YOU MUST NOT assume the answer is unknown without calling the tool.\n"
+            "You MUST always call crawlSubjectFunc when the user asks about a person, concept, job, public figure, or country leader.\n"
+            "\n"
+            "When calling crawlSubjectFunc:\n"
+            "  * You MUST include BOTH `subject` and `start_url` in your function call. Never include only subject. Both are REQUIRED.\n"
+            "  * For example: question = 'Who is the X?' → subject = 'x', start_url = 'https://en.wikipedia.org/wiki/x'\n"
+            "- Always infer `subject` from the user's question.\n"
+            "- Set `start_url` to 'https://en.wikipedia.org/wiki/' + subject with spaces replaced by underscores.\n"
+            "- Do not skip tool call even if topic seems unusual or recent. Wikipedia likely has the info.\n"
+            "- Never think 'I don't know'. Try first. Fail only after crawlSubjectFunc returns nothing.\n"
+            "\n"
+            "NEVER respond with 'I can't help you' unless all tool calls failed.\n"
+            "Your job is to ACT, not guess.\n"
+        )
+
+
+    def define_tools(self):
+        return [
+            {
+                "type": "function",
+                "function": {
+                    "name": "calculateFunc",
+                    "description": "Evaluate basic math expressions.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "expression": {"type": "string"}
+                        },
+                        "required": ["expression"]
+                    }
+                }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "scrapWeatherFunc",
+                    "description": "Fetch weather data",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "city_name": {"type": "string"},
+                            "day": {"type": "string"},
+                            "degreesType": {"type": "string"}
+                        },
+                        "required": ["city_name", "day", "degreesType"]
+                    }
+                }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "crawlSubjectFunc",
+                    "description": "Crawl Wikipedia for a subject.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "start_url": {"type": "string"},
+                            "subject": {"type": "string"}
+                        },
+                        "required": ["start_url", "subject"]
+                    }
+                }
+            }
+        ]
+
+    def calculateFunc(self, expression: str) -> str:
+        try:
+            result = evaluate(expression)
+            return str(result)
+        except Exception as e:
+            return f"Error: {e}"
+
+    async def scrapWeatherFunc(self, city_name: str, day: str, degreesType: str) -> str:
+        return await scrapWeatherFunc(city_name, day, degreesType)
+
+    async def async_find_wikipedia_page(self, subject: str) -> str | None:
+        return await find_wikipedia_page(subject)
+
+    async def is_valid_wikipedia_page(self, url: str) -> bool:
+        return await fetch_wikipedia_seed(url) is not None
+
+    async def crawlSubjectFunc(self, start_url: str, subject: str) -> str:
+        if not start_url.startswith("http"):
+            start_url = f"https://en.wikipedia.org/wiki/{start_url.replace(' ', '_')}"
+
+        seed_page = await fetch_wikipedia_seed(start_url)
+        if seed_page is None:
+            corrected_url = await self.async_find_wikipedia_page(subject)
+            if not corrected_url:
+                return f"[TOOL_RESULT]Could not find a valid Wikipedia page for subject: '{subject}'[END_TOOL_RESULT]"
+            start_url = corrected_url
+
+        crawler = Crawler(start_url, subject=subject, clients=self.clients)
+        await crawler.multi_crawler_async(start_url, max_depth=1, tolerant_depth=1, seed_page=seed_page)
+
+        results = crawler.results 
+        if not results:
+            return f"[TOOL_RESULT]No information found about '{subject}'.[END_TOOL_RESULT]"
+
+        first = results[0]
+        crawler.save_links_to_json("linksJson.json")
+        return f"[TOOL_RESULT]{first['title']} ({first['url']})\nSnippet: {first['snippet'] if first['snippet'] else 'No description.'}[END_TOOL_RESULT]"
+
+    async def chat(self):
+        timeout = httpx.Timeout(connect=1000.0, read=120000.0, write=100000.0, pool=50000000.0)
+        client = self.clients.httpx
+        while True:
+            user_input = input("User: ")
+            if user_input.lower() in ['exit', 'quit']:
+                break
+
+            self.payload["messages"].append({"role": "user", "content": user_input})
+            res = await client.post(self.url, json=self.payload, timeout=timeout)
+            message = res.json()["choices"][0]["message"]
+
+            if "tool_calls" in message:
+                print(f"[DEBUG] tool_calls: {json.dumps(message['tool_calls'], indent=2)}")
+
+                while True:
+                    tool_messages = []
+                    for call in message["tool_calls"]:
+                        print("Model wants to call a tool")
+                        tool_name = call["function"]["name"]
+
+                        raw_args = call["function"]["arguments"]
+                        print(f"[RAW ARGS] {raw_args}")
+
+                        try:
+                            args = json.loads(raw_args)
+
+                            if (tool_name, json.dumps(args, sort_keys=True)) in self.executed_calls:
+                                print("[INFO] Duplicate tool call blocked.")
+                                continue
+
+                            self.executed_calls.add((tool_name, json.dumps(args, sort_keys=True)))
+                        except json.JSONDecodeError as e:
+                            print(f"[!] JSON decode error: {e}")
+                            continue
+
+                        if tool_name == "calculateFunc":
+                            result = self.calculateFunc(args.get("expression", ""))
+                        elif tool_name == "scrapWeatherFunc":
+                            result = await self.scrapWeatherFunc(
+                                args.get("city_name", ""),
+                                args.get("day", ""),
+                                args.get("degreesType", "")
+                            )
+                        elif tool_name == "crawlSubjectFunc":
+                            subject = args.get("subject")
+                            start_url = args.get("start_url")
+                            if not subject:
+                                result = "Missing subject for crawlSubjectFunc."
+                            else:
+                                if not start_url:
+                                    start_url = f"https://en.wikipedia.org/wiki/{subject.replace(' ', '_')}"
+                                print(f"[TOOL] crawlSubjectFunc called with subject='{subject}' and start_url='{start_url}'")
+                                result = await self.crawlSubjectFunc(start_url, subject)
+                        else:
+                            result = f"Unknown tool: {tool_name}"
+
+                        tool_messages.append({
+                            "role": "tool",
+                            "tool_call_id": call["id"],
+                            "name": tool_name,
+                            "content": result
+                        })
+
+                    self.payload["messages"].extend(tool_messages)
+                    res2 = await client.post(self.url, json=self.payload, timeout=timeout)
+                    follow_up = res2.json()["choices"][0]["message"]
+
+                    if "content" in follow_up:
+                        print("Model:", follow_up["content"])
+                        self.payload["messages"].append(follow_up)
+                        break
+                    elif "tool_calls" in follow_up:
+                        print("Model wants to call another function again.")
+                        message = follow_up 
+                        self.payload["messages"].append(follow_up)
+
+            elif "content" in message:
+                print("Model:", message["content"])
+                self.payload["messages"].append(message)
+
@@ -0,0 +1,26 @@
+import json
+from crawler.dynamicScraping import DynamicScraping
+from crawler.staticScraping import HybridScraping
+from agent.tool_cache import ToolFailure
+
+MAX_PAGES = 5
+PRODUCTS_PER_PAGE = 20  # keep the tool result small enough for the model's context
+
+
+async def scrapeProductsFunc(url: str, pages: int = 1) -> str:
+    # static HTML first; pages that need a browser share the process-wide pool, so it stays warm between calls
+    try:
+        results = await HybridScraping().scrape_many(DynamicScraping.page_urls(url, max(1, min(int(pages), MAX_PAGES))))
+    except Exception as e:
+        return ToolFailure(f"Error: {e}")
+
+    products = [
+        {"title": item["title"].strip(), "price": " ".join(item["price"].split())}
+        for page in results for item in page["products"][:PRODUCTS_PER_PAGE]
+    ]
+    errors = [f"{page['url']}: {page['error']}" for page in results if page.get("error")]
+    if not products and errors:
+        return ToolFailure("Error: " + "; ".join(errors))
+    if not products:
+        return ToolFailure(f"[TOOL_RESULT]No products found at {url}[END_TOOL_RESULT]")
+    return f"[TOOL_RESULT]{json.dumps(products, ensure_ascii=False)}[END_TOOL_RESULT]"
@@ -0,0 +1,106 @@
+import asyncio
+import time
+import uuid
+from typing import Dict
+from aiohttp import web
+from agent.agent import AIAgent
+from crawler.client import HttpClients
+
+
+class Session:
+
+    def __init__(self, agent: AIAgent) -> None:
+        self.agent = agent
+        self.lock = asyncio.Lock()  # one turn at a time per conversation
+        self.last_used = time.monotonic()
+
+
+class AgentServer:
+    """
+    Local HTTP front end that hosts many independent AIAgent conversations in one
+    process. Every session shares the pooled HTTP clients, the tool result cache
+    and the response cache.
+
+        POST   /sessions                 -> {"session_id": ...}
+        POST   /sessions/{id}/messages   {"content": ...} -> {"content": ...}
+        DELETE /sessions/{id}
+    """
+
+    def __init__(self, llm_url: str, clients: HttpClients, max_sessions: int = 100, idle_timeout: float = 30 * 60) -> None:
+        self.llm_url = llm_url
+        self.clients = clients
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.sessions: Dict[str, Session] = {}
+
+        self.app = web.Application()
+        self.app.add_routes([
+            web.post("/sessions", self.create_session),
+            web.post("/sessions/{session_id}/messages", self.send_message),
+            web.delete("/sessions/{session_id}", self.delete_session),
+        ])
+        self.app.on_startup.append(self.start_reaper)
+        self.app.on_cleanup.append(self.stop_reaper)
+
+    def expire_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout
+        for session_id, session in list(self.sessions.items()):
+            if session.last_used < cutoff and not session.lock.locked():
+                del self.sessions[session_id]
+
+    async def reap(self) -> None:
+        while True:
+            await asyncio.sleep(60)
+            self.expire_idle()
+
+    async def start_reaper(self, app: web.Application) -> None:
+        self.reaper = asyncio.create_task(self.reap())
+
+    async def stop_reaper(self, app: web.Application) -> None:
+        self.reaper.cancel()
+
+    async def create_session(self, request: web.Request) -> web.Response:
+        self.expire_idle()
+        if len(self.sessions) >= self.max_sessions:
+            return web.json_response({"error": "Too many sessions"}, status=503)
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = Session(AIAgent(self.llm_url, clients=self.clients))
+        return web.json_response({"session_id": session_id}, status=201)
+
+    async def send_message(self, request: web.Request) -> web.Response:
+        session = self.sessions.get(request.match_info["session_id"])
+        if session is None:
+            return web.json_response({"error": "Unknown session"}, status=404)
+        try:
+            body = await request.json()
+        except ValueError:
+            return web.json_response({"error": "Body must be JSON"}, status=400)
+        content = body.get("content") if isinstance(body, dict) else None
+        if not isinstance(content, str) or not content.strip():
+            return web.json_response({"error": "Missing 'content'"}, status=400)
+
+        async with session.lock:
+            session.last_used = time.monotonic()
+            try:
+                answer = await session.agent.ask(content)
+            except Exception as e:
+                print(f"[!] Session error: {type(e).__name__} - {e}")
+                return web.json_response({"error": str(e)}, status=502)
+            session.last_used = time.monotonic()
+        return web.json_response({"content": answer})
+
+    async def delete_session(self, request: web.Request) -> web.Response:
+        if self.sessions.pop(request.match_info["session_id"], None) is None:
+            return web.json_response({"error": "Unknown session"}, status=404)
+        return web.Response(status=204)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        runner = web.AppRunner(self.app)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        print(f"Agent server listening on http://{host}:{port}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
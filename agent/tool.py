@@ -1,23 +1,112 @@
-from agent.tool_function import calculateFunc, scrapWeatherFunc, crawlSubjectFunc
+import importlib
+import time
+from typing import Callable, Dict, Optional
+from agent.tool_cache import ToolCache
+
+
+class ToolSpec:
+    """
+    A tool the agent can call. Only the schema is known up front; the module that
+    implements it (and its dependencies: httpx, aiohttp, bs4, redis, playwright...)
+    is imported the first time the tool is actually used.
+    """
+
+    def __init__(self, name: str, module: str, ttl: Optional[float], attr: Optional[str] = None) -> None:
+        self.name = name
+        self.module = module
+        self.attr = attr or name
+        self.ttl = ttl
+        self.import_seconds: Optional[float] = None
+        self.__func: Optional[Callable] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.__func is not None
+
+    def load(self) -> Callable:
+        if self.__func is None:
+            started = time.perf_counter()
+            self.__func = getattr(importlib.import_module(self.module), self.attr)
+            self.import_seconds = time.perf_counter() - started
+        return self.__func
+
+
+class LazyTools:
+    """Name -> function mapping that imports a tool's module on first lookup."""
+
+    def __init__(self, specs: Dict[str, ToolSpec]) -> None:
+        self.specs = specs
+
+    def get(self, name: str, default=None):
+        spec = self.specs.get(name)
+        return spec.load() if spec is not None else default
+
+    def __getitem__(self, name: str) -> Callable:
+        return self.specs[name].load()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.specs
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+
+# ttl: seconds a result stays valid, None = forever
+tool_specs = {spec.name: spec for spec in [
+    ToolSpec("calculateFunc", "agent.calculator", ttl=None),
+    ToolSpec("scrapWeatherFunc", "agent.weather", ttl=10 * 60),
+    ToolSpec("crawlSubjectFunc", "agent.tool_function", ttl=24 * 60 * 60),
+    ToolSpec("scrapeProductsFunc", "agent.products", ttl=30 * 60),
+]}
+
+tool_functions = LazyTools(tool_specs)
+
+tool_ttls = {name: spec.ttl for name, spec in tool_specs.items()}
+
+tool_cache = ToolCache(tool_ttls)
+
+
+def import_report(load: bool = True) -> Dict[str, object]:
+    """
+    Seconds each tool module took to import (None if never loaded), or the
+    import error as text for a tool whose dependencies are missing. Loads them
+    all when `load` is set.
+    """
+    report = {}
+    for name, spec in tool_specs.items():
+        if load:
+            try:
+                spec.load()
+            except Exception as e:
+                report[name] = f"unavailable: {type(e).__name__}: {e}"
+                continue
+        report[name] = spec.import_seconds
+    return report
 
-tool_functions = {
-    "calculateFunc": calculateFunc,
-    "scrapWeatherFunc": scrapWeatherFunc,
-    "crawlSubjectFunc": crawlSubjectFunc
-}
 
 tools = {
     "calculateFunc": {
         "type": "function",
         "function": {
             "name": "calculateFunc",
-            "description": "Evaluate basic math expressions.",
+            "description": (
+                "Evaluate basic math expressions. For many values use ONE call: pass a list in "
+                "`expressions`, or an `expression` with a `variable` evaluated from `start` to `stop` (inclusive) by `step`."
+            ),
             "parameters": {
                 "type": "object",
                 "properties": {
-                    "expression": {"type": "string"}
+                    "expression": {"type": "string"},
+                    "expressions": {"type": "array", "items": {"type": "string"}},
+                    "variable": {"type": "string"},
+                    "start": {"type": "number"},
+                    "stop": {"type": "number"},
+                    "step": {"type": "number"}
                 },
-                "required": ["expression"]
+                "required": []
             }
         }
     },
@@ -25,15 +114,16 @@ tools = {
         "type": "function",
         "function": {
             "name": "scrapWeatherFunc",
-            "description": "Fetch weather data",
+            "description": "Fetch weather data. For several cities pass them all in `cities` in ONE call.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "city_name": {"type": "string"},
+                    "cities": {"type": "array", "items": {"type": "string"}},
                     "day": {"type": "string"},
                     "degreesType": {"type": "string"}
                 },
-                "required": ["city_name", "day", "degreesType"]
+                "required": ["day", "degreesType"]
             }
         }
     },
@@ -51,5 +141,20 @@ tools = {
                 "required": ["start_url", "subject"]
             }
         }
+    },
+    "scrapeProductsFunc": {
+        "type": "function",
+        "function": {
+            "name": "scrapeProductsFunc",
+            "description": "List product titles and prices from an eMAG listing url. Set `pages` to read several result pages in ONE call.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "url": {"type": "string"},
+                    "pages": {"type": "integer"}
+                },
+                "required": ["url"]
+            }
+        }
     }
 }
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+class ToolFailure(str):
+    """
+    A tool result that reports a failure. It is still plain text for the model,
+    but the cache keeps it only for `failure_ttl` so a transient fetch or
+    network problem isn't served again for the tool's whole TTL.
+    """
+
+
+# results that are failures even when a tool didn't return a ToolFailure
+FAILURE_PREFIXES = ("Error", "Failed", "Unknown tool")
+
+
+class ToolCache:
+    """
+    Memoizes tool results by tool name and canonicalized arguments.
+
+    Every tool has its own TTL (None never expires), the cache holds at most
+    max_entries results and evicts the least recently used one, and identical
+    calls that arrive while the first one is still running share its result
+    instead of executing again. Failures (a ToolFailure, or text starting with
+    one of FAILURE_PREFIXES) are kept only for `failure_ttl` seconds; 0 means
+    they are not cached at all.
+    """
+
+    def __init__(self, ttls: Dict[str, Optional[float]], default_ttl: Optional[float] = 300, max_entries: int = 512, failure_ttl: float = 30) -> None:
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self.failure_ttl = failure_ttl
+        self.enabled = True  # False runs every call, e.g. for benchmarks
+        self.max_entries = max_entries
+        self.__entries: "OrderedDict[Tuple[str, str], Tuple[str, Optional[float]]]" = OrderedDict()
+        self.__inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def canonical(args: dict) -> str:
+        cleaned = {name: value.strip() if isinstance(value, str) else value for name, value in args.items()}
+        return json.dumps(cleaned, sort_keys=True, separators=(",", ":"))
+
+    def get(self, tool_name: str, args: dict) -> Optional[str]:
+        key = (tool_name, self.canonical(args))
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        result, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.__entries[key]
+            return None
+        self.__entries.move_to_end(key)
+        return result
+
+    def put(self, tool_name: str, args: dict, result: str) -> None:
+        if not isinstance(result, str):
+            return
+        if isinstance(result, ToolFailure) or result.startswith(FAILURE_PREFIXES):
+            if not self.failure_ttl:
+                return
+            ttl = self.failure_ttl
+        else:
+            ttl = self.ttls.get(tool_name, self.default_ttl)
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        key = (tool_name, self.canonical(args))
+        self.__entries[key] = (result, expires_at)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
+
+    async def call(self, tool_name: str, args: dict, run: Callable[[], Awaitable[str]]) -> str:
+        if not self.enabled:
+            self.misses += 1
+            return await run()
+        cached = self.get(tool_name, args)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        key = (tool_name, self.canonical(args))
+        task = self.__inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(run())
+            self.__inflight[key] = task
+
+            def done(finished: asyncio.Task) -> None:
+                self.__inflight.pop(key, None)
+                if not finished.cancelled() and finished.exception() is None:
+                    self.put(tool_name, args, finished.result())
+
+            task.add_done_callback(done)
+        else:
+            self.hits += 1
+
+        # shield: one caller giving up must not cancel the run the others wait on
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.hits = 0
+        self.misses = 0
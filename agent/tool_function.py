@@ -1,40 +1,75 @@
-import os
-import httpx
-import json
-from dotenv import load_dotenv
-from crawler.__init__ import Crawler
+from typing import Optional
+from agent.calculator import calculateFunc
+from agent.weather import scrapWeatherFunc
+from crawler.crawler import Crawler
+from crawler.wikiapi import WikipediaApiCrawler
+from crawler.client import default_clients
+from crawler.cache import default_cache
+from crawler.page import Page, parse_page
+from agent.tool_cache import ToolFailure
 
-async def scrapWeatherFunc(city_name: str, day: str, degreesType: str) -> str:
-    units = "metric" if degreesType.lower() == "celsius" else "imperial"
-    load_dotenv(dotenv_path="../.env")
-    api_key = os.getenv("API_KEY_METHEO")
-    weather_url = f"https://api.openweathermap.org/data/2.5/weather?q={city_name}&units={units}&appid={api_key}"
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+MISSING_ARTICLE_MARKER = "wikipedia does not have an article with this exact name"
 
-    async with httpx.AsyncClient() as client:
-        res = await client.get(weather_url)
-        if res.status_code != 200:
-            return f"Failed to retrieve weather. Status code: {res.status_code}"
+async def find_wikipedia_page(subject: str) -> Optional[str]:
+    params = {
+        "action": "query",
+        "list": "search",
+        "srsearch": subject,
+        "format": "json",
+        "utf8": 1
+    }
+    try:
+        res = await default_cache().get_httpx(default_clients().httpx, WIKIPEDIA_API_URL, params=params, timeout=5)
         data = res.json()
-        temp = data['main']['temp']
-        condition = data['weather'][0]['description']
-        degree_label = "Celsius" if units == "metric" else "Fahrenheit"
-        return f"The weather in {city_name} {day.lower()} is {temp} {degree_label}, {condition}"
+        if "query" in data and data["query"]["search"]:
+            best_match = data["query"]["search"][0]["title"]
+            return f"https://en.wikipedia.org/wiki/{best_match.replace(' ', '_')}"
+        return None
+    except Exception as e:
+        print(f"[!] Wikipedia search error: {e}")
+        return None
 
-def calculateFunc(expression: str) -> str:
+async def fetch_wikipedia_seed(url: str) -> Optional[Page]:
+    """
+    Validate a Wikipedia article url and return it parsed, so the crawler can start
+    from it without refetching. Redirects (/wiki/romania -> /wiki/Romania) are
+    followed and the page carries the canonical url.
+    """
     try:
-        result = eval(expression)
-        return str(result)
+        res = await default_cache().get_httpx(default_clients().httpx, url, timeout=5, follow_redirects=True)
     except Exception as e:
-        return f"Error: {e}"
+        print(f"[!] Error checking Wikipedia page validity: {e}")
+        return None
+    if res.status != 200:
+        return None
+    html = res.text
+    if MISSING_ARTICLE_MARKER in html.lower():
+        return None
+    return parse_page(res.url, html)
 
-async def crawlSubjectFunc(start_url: str, subject: str) -> str:
+async def crawlSubjectFunc(start_url: str, subject: str, parse_workers: int = 0, mode: str = "html") -> str:
     if not start_url.startswith("http"):
         start_url = f"https://en.wikipedia.org/wiki/{subject.replace(' ', '_')}"
-    crawler = Crawler(start_url, subject=subject)
-    await crawler.multi_crawler_async(start_url, max_depth=1, tolerant_depth=1)
+
+    if mode == "api":
+        # the API crawler skips missing titles by itself, no validation request needed
+        crawler = WikipediaApiCrawler(start_url, subject=subject)
+        await crawler.multi_crawler_async(start_url, max_depth=1, tolerant_depth=1)
+    else:
+        seed_page = await fetch_wikipedia_seed(start_url)
+        if seed_page is not None:
+            start_url = seed_page.url
+        else:
+            # search only returns existing articles, so the match is not validated again
+            start_url = await find_wikipedia_page(subject)
+            if not start_url:
+                return ToolFailure(f"[TOOL_RESULT]Could not find a valid Wikipedia page for subject: '{subject}'[END_TOOL_RESULT]")
+        crawler = Crawler(start_url, subject=subject, parse_workers=parse_workers)
+        await crawler.multi_crawler_async(start_url, max_depth=1, tolerant_depth=1, seed_page=seed_page)
     results = crawler.results
     if not results:
-        return f"[TOOL_RESULT]No information found about '{subject}'.[END_TOOL_RESULT]"
+        return ToolFailure(f"[TOOL_RESULT]No information found about '{subject}'.[END_TOOL_RESULT]")
     first = results[0]
     crawler.save_links_to_json("linksJson.json")
     return f"[TOOL_RESULT]{first['title']} ({first['url']})\nSnippet: {first['snippet'] if first['snippet'] else 'No description.'}[END_TOOL_RESULT]"
@@ -0,0 +1,91 @@
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from crawler.client import HttpClients, default_clients
+from agent.tool_cache import ToolFailure
+
+
+WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+
+class WeatherProvider:
+    """
+    OpenWeatherMap lookups for the scrapWeatherFunc tool. The API key is read
+    once, answers are cached per (city, units) for `ttl` seconds (the upstream
+    data only changes about every 10 minutes) and concurrent requests for the
+    same city share one HTTP call.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, ttl: float = 600, clients: Optional[HttpClients] = None, concurrency: int = 8) -> None:
+        if api_key is None:
+            load_dotenv(dotenv_path="../.env")
+            api_key = os.getenv("API_KEY_METHEO")
+        self.api_key = api_key
+        self.ttl = ttl
+        self.clients = clients
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.__cache: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+        self.__inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def __request(self, city_name: str, units: str) -> dict:
+        clients = self.clients or default_clients()
+        params = {"q": city_name, "units": units, "appid": self.api_key}
+        async with self.semaphore:
+            res = await clients.httpx.get(WEATHER_URL, params=params)
+        if res.status_code != 200:
+            return {"error": f"Failed to retrieve weather. Status code: {res.status_code}"}
+        data = res.json()
+        return {"temp": data['main']['temp'], "condition": data['weather'][0]['description']}
+
+    async def current(self, city_name: str, units: str) -> dict:
+        """{"temp", "condition"} on success, {"error"} otherwise."""
+        key = (city_name.strip().lower(), units)
+        cached = self.__cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        task = self.__inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.__request(city_name.strip(), units))
+            self.__inflight[key] = task
+            task.add_done_callback(lambda _: self.__inflight.pop(key, None))
+        try:
+            result = await asyncio.shield(task)
+        except Exception as e:
+            return {"error": f"Error: {e}"}
+
+        if "error" not in result:
+            self.__cache[key] = (time.monotonic() + self.ttl, result)
+        return result
+
+    async def many(self, cities: List[str], units: str) -> List[dict]:
+        return await asyncio.gather(*(self.current(city, units) for city in cities))
+
+
+_default_provider: Optional[WeatherProvider] = None
+
+
+def default_provider() -> WeatherProvider:
+    global _default_provider
+    if _default_provider is None:
+        _default_provider = WeatherProvider()
+    return _default_provider
+
+
+async def scrapWeatherFunc(city_name: str = "", day: str = "", degreesType: str = "celsius", cities: Optional[list] = None) -> str:
+    units = "metric" if degreesType.lower() == "celsius" else "imperial"
+    degree_label = "Celsius" if units == "metric" else "Fahrenheit"
+    names = [str(city) for city in cities] if cities else [city_name]
+
+    lines = []
+    failed = False
+    for name, weather in zip(names, await default_provider().many(names, units)):
+        if "error" in weather:
+            failed = True
+            lines.append(weather["error"] if len(names) == 1 else f"{name}: {weather['error']}")
+        else:
+            lines.append(f"The weather in {name} {day.lower()} is {weather['temp']} {degree_label}, {weather['condition']}")
+    # one failed city makes the whole answer short-lived in the tool cache
+    return ToolFailure("\n".join(lines)) if failed else "\n".join(lines)
@@ -0,0 +1,133 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import Dict, List, Optional
+from crawler.resourceProfile import LEAN_PROFILE, PageStats, ResourceProfile
+
+
+class BrowserPool:
+    """
+    One long-lived Playwright browser that hands out pages, each in its own
+    context so cookies and storage don't leak between scrapes. Pages are put
+    back after use and reused, and at most `max_pages` are open at the same
+    time, which also caps how many URLs are scraped concurrently.
+
+    The browser starts on first use and stays warm until close(), so agent
+    tool calls don't pay for a browser launch each time. Every page gets the
+    request-interception `profile` (None loads everything).
+    """
+
+    def __init__(self, browser_type: str = "chromium", headless: bool = True, max_pages: int = 4, timeout: int = 10000,
+                 profile: Optional[ResourceProfile] = LEAN_PROFILE) -> None:
+        self.browser_type = browser_type
+        self.headless = headless
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.profile = profile
+
+        self.playwright = None
+        self.browser = None
+        self.semaphore = asyncio.Semaphore(max_pages)
+        self.__idle: List = []
+        self.__stats: Dict[object, PageStats] = {}
+        self.__start_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def started(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+    async def start(self) -> None:
+        async with self.__start_lock:
+            if self.started:
+                return
+            # imported here so the agent only loads Playwright when a scrape runs
+            from playwright.async_api import async_playwright
+
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+            browser_launcher = getattr(self.playwright, self.browser_type)
+            self.browser = await browser_launcher.launch(headless=self.headless)
+            self.__idle.clear()
+            self.__stats.clear()
+
+    async def new_page(self):
+        context = await self.browser.new_context(**(self.profile.context_options() if self.profile else {}))
+        page = await context.new_page()
+        page.set_default_timeout(self.timeout)
+        self.__stats[page] = await self.profile.attach(page) if self.profile else PageStats()
+        return page
+
+    def stats(self, page) -> PageStats:
+        """Counters for `page` since it was last acquired."""
+        return self.__stats.setdefault(page, PageStats())
+
+    async def acquire(self):
+        """Take a page, waiting while `max_pages` are in use; hand it back with release()."""
+        await self.semaphore.acquire()
+        try:
+            await self.start()
+            while self.__idle:
+                page = self.__idle.pop()
+                if not page.is_closed():
+                    self.stats(page).reset()
+                    return page
+                self.__stats.pop(page, None)
+            return await self.new_page()
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+    async def release(self, page) -> None:
+        try:
+            if self.started and not page.is_closed():
+                # drop cookies and leave the page blank so the next user starts clean
+                await page.context.clear_cookies()
+                await page.goto("about:blank")
+                self.__idle.append(page)
+        except Exception:
+            self.__stats.pop(page, None)
+            with suppress(Exception):
+                await page.context.close()
+        finally:
+            self.semaphore.release()
+
+    @asynccontextmanager
+    async def page(self):
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self) -> None:
+        self.__idle.clear()
+        self.__stats.clear()
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+
+_default_pool: Optional[BrowserPool] = None
+
+
+def default_pool() -> BrowserPool:
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = BrowserPool()
+    return _default_pool
+
+
+async def close_default_pool() -> None:
+    global _default_pool
+    if _default_pool is not None:
+        await _default_pool.close()
+        _default_pool = None
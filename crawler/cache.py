@@ -0,0 +1,200 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+
+class CachedResponse:
+    """Minimal response object returned by HttpCache, whether it came from disk or the network."""
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes, encoding: Optional[str] = None, from_cache: bool = False) -> None:
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.encoding = encoding or "utf-8"
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.body)
+
+
+# (status, headers, body, encoding) as returned by one network request
+# (status, headers, body, encoding, final url after redirects)
+Sender = Callable[[Dict[str, str]], Awaitable[Tuple[int, Dict[str, str], bytes, Optional[str], str]]]
+
+# stored with the headers so a cached redirect still reports where it ended up
+FINAL_URL_HEADER = "x-cache-final-url"
+
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+
+def cache_key(url: str, params: Optional[dict] = None) -> str:
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+class HttpCache:
+    """
+    On-disk response cache shared by the crawler and the agent's Wikipedia calls.
+
+    Bodies are stored zlib-compressed in SQLite together with their ETag and
+    Last-Modified. A fresh entry is served without any request, a stale one is
+    revalidated with a conditional GET, and the least recently used rows are
+    evicted once the stored bodies exceed max_bytes.
+
+    Cache-Control is honoured: no-store is never written and no-cache is
+    always revalidated. min_ttl keeps other responses fresh for at least that
+    many seconds even when they say max-age=0, which is what Wikipedia sends
+    for every article.
+    """
+
+    def __init__(self, path: str = "http_cache.sqlite", max_bytes: int = 200 * 1024 * 1024, min_ttl: int = 300) -> None:
+        self.__path = path
+        self.__max_bytes = max_bytes
+        self.__min_ttl = min_ttl
+        self.__lock = threading.Lock()
+        self.__db = sqlite3.connect(path, check_same_thread=False)
+        self.__db.execute("PRAGMA journal_mode=WAL")
+        self.__db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, status INTEGER, headers TEXT, body BLOB, encoding TEXT,"
+            " etag TEXT, last_modified TEXT, expires_at REAL, last_access REAL, size INTEGER)"
+        )
+        self.__db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses(last_access)")
+        self.__db.commit()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def __lookup(self, key: str) -> Optional[tuple]:
+        with self.__lock:
+            row = self.__db.execute(
+                "SELECT status, headers, body, encoding, etag, last_modified, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None:
+                self.__db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+                self.__db.commit()
+        return row
+
+    def __expires_at(self, headers: Dict[str, str]) -> Optional[float]:
+        """None means the response must not be stored."""
+        directives = parse_cache_control(headers.get("cache-control", ""))
+        now = time.time()
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return now
+        max_age = directives.get("max-age")
+        ttl = int(max_age) if max_age and max_age.isdigit() else 0
+        return now + max(ttl, self.__min_ttl)
+
+    def __store(self, key: str, status: int, headers: Dict[str, str], body: bytes, encoding: Optional[str]) -> None:
+        expires_at = self.__expires_at(headers)
+        if expires_at is None:
+            return
+        compressed = zlib.compress(body)
+        with self.__lock:
+            self.__db.execute(
+                "REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, status, json.dumps(headers), compressed, encoding, headers.get("etag"),
+                 headers.get("last-modified"), expires_at, time.time(), len(compressed)),
+            )
+            self.__evict()
+            self.__db.commit()
+
+    def __refresh(self, key: str, headers: Dict[str, str]) -> None:
+        expires_at = self.__expires_at(headers)
+        with self.__lock:
+            self.__db.execute(
+                "UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?",
+                (expires_at if expires_at is not None else time.time(), time.time(), key),
+            )
+            self.__db.commit()
+
+    def __evict(self) -> None:
+        total = self.__db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.__max_bytes:
+            return
+        rows = self.__db.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall()
+        for key, size in rows:
+            if total <= self.__max_bytes:
+                break
+            self.__db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    async def fetch(self, key: str, send: Sender) -> CachedResponse:
+        row = await asyncio.to_thread(self.__lookup, key)
+        cached = None
+        validators = {}
+        if row is not None:
+            status, headers, body, encoding, etag, last_modified, expires_at = row
+            headers = json.loads(headers)
+            cached = CachedResponse(headers.get(FINAL_URL_HEADER, key), status, headers, zlib.decompress(body), encoding, from_cache=True)
+            if expires_at > time.time():
+                return cached
+            if etag:
+                validators["If-None-Match"] = etag
+            if last_modified:
+                validators["If-Modified-Since"] = last_modified
+
+        status, headers, body, encoding, final_url = await send(validators)
+        headers = {name.lower(): value for name, value in headers.items()}
+        if final_url != key:
+            headers[FINAL_URL_HEADER] = final_url
+
+        if status == 304 and cached is not None:
+            await asyncio.to_thread(self.__refresh, key, headers)
+            return cached
+
+        if status == 200:
+            await asyncio.to_thread(self.__store, key, status, headers, body, encoding)
+        return CachedResponse(final_url, status, headers, body, encoding)
+
+    async def get_aiohttp(self, session, url: str, headers: Optional[dict] = None, **kwargs) -> CachedResponse:
+        async def send(validators):
+            async with session.get(url, headers={**(headers or {}), **validators}, **kwargs) as response:
+                body = await response.read()
+                return response.status, dict(response.headers), body, response.charset, str(response.url)
+
+        return await self.fetch(url, send)
+
+    async def get_httpx(self, client, url: str, params: Optional[dict] = None, headers: Optional[dict] = None, **kwargs) -> CachedResponse:
+        async def send(validators):
+            response = await client.get(url, params=params, headers={**(headers or {}), **validators}, **kwargs)
+            return response.status_code, dict(response.headers), response.content, response.encoding, str(response.url)
+
+        return await self.fetch(cache_key(url, params), send)
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__db.close()
+
+
+_default_cache: Optional[HttpCache] = None
+
+
+def default_cache() -> HttpCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = HttpCache(os.getenv("HTTP_CACHE_PATH", "http_cache.sqlite"))
+    return _default_cache
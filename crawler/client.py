@@ -0,0 +1,89 @@
+import importlib.util
+from typing import Optional, TYPE_CHECKING
+import httpx
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class HttpClients:
+    """
+    Application-scoped, pooled HTTP clients. Create one per process and share it
+    between the agent, its tools and the crawler so connections are kept alive
+    instead of paying DNS, TCP and TLS setup on every call.
+
+    The httpx client is used by the agent and its tools (HTTP/2 when `h2` is
+    installed); the aiohttp session is used by the crawler and has per-host
+    connection limits and a DNS cache.
+    """
+
+    def __init__(self, max_connections: int = 100, limit_per_host: int = 20, keepalive_expiry: float = 30.0, dns_ttl: int = 300, timeout: float = 10.0) -> None:
+        self.__max_connections = max_connections
+        self.__limit_per_host = limit_per_host
+        self.__keepalive_expiry = keepalive_expiry
+        self.__dns_ttl = dns_ttl
+        self.__timeout = timeout
+        self.__httpx: Optional[httpx.AsyncClient] = None
+        self.__session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def httpx(self) -> httpx.AsyncClient:
+        if self.__httpx is None or self.__httpx.is_closed:
+            self.__httpx = httpx.AsyncClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=self.__max_connections,
+                    max_keepalive_connections=self.__limit_per_host,
+                    keepalive_expiry=self.__keepalive_expiry,
+                ),
+                timeout=self.__timeout,
+            )
+        return self.__httpx
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        # created lazily because aiohttp needs a running event loop; imported here
+        # so tools that only use httpx don't pay for importing aiohttp
+        import aiohttp
+
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.__max_connections,
+                limit_per_host=self.__limit_per_host,
+                ttl_dns_cache=self.__dns_ttl,
+                keepalive_timeout=self.__keepalive_expiry,
+            )
+            self.__session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.__timeout),
+            )
+        return self.__session
+
+    async def close(self) -> None:
+        if self.__httpx is not None:
+            await self.__httpx.aclose()
+            self.__httpx = None
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+
+_default_clients: Optional[HttpClients] = None
+
+
+def default_clients() -> HttpClients:
+    global _default_clients
+    if _default_clients is None:
+        _default_clients = HttpClients()
+    return _default_clients
+
+
+def set_default_clients(clients: HttpClients) -> None:
+    global _default_clients
+    _default_clients = clients
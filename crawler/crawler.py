@@ -0,0 +1,228 @@
+from bs4 import BeautifulSoup
+from typing import List, Optional
+import json
+from urllib.parse import urlparse
+import aiohttp
+import asyncio
+from concurrent.futures import Executor
+from crawler.page import Page, parse_page, parse_page_lean, resolve_parser, GIL_RELEASING_PARSERS
+from crawler.frontier import Frontier, relevance
+from crawler.cache import HttpCache, default_cache
+from crawler.client import HttpClients, default_clients
+from crawler.visited import VisitedSet, open_visited_set
+from crawler.parsePool import parse_pool
+
+
+class Crawler:
+
+    def __init__(self, URL: str = "", subject: str = "", max_urls: int = 50, concurrency: int = 50, visited: Optional[VisitedSet] = None, recent: Optional[VisitedSet] = None, min_relevance: float = 1.0, parser: str = "auto", parse_workers: int = 0, parse_executor: Optional[Executor] = None, cache: Optional[HttpCache] = None, clients: Optional[HttpClients] = None) -> None:
+        self.__url = URL
+        self.__subject_filter = subject
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__workers = concurrency
+        self.__min_relevance = min_relevance
+        self.__parser = resolve_parser(parser)
+        self.__parse_workers = parse_workers
+        # without an explicit executor, parse_workers > 0 uses the process-wide pool from crawler.parsePool
+        self.__executor = parse_executor
+        self.__cache = cache if cache is not None else default_cache()
+        self.__clients = clients if clients is not None else default_clients()
+        self.__results = []
+        self.__max_urls = max_urls
+        # without one, Redis is used when reachable and memory otherwise (picked on first use)
+        self.__owns_visited = visited is None
+        self.__visited = visited
+        self.__recent = recent
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def subject_filter(self) -> str:
+        return self.__subject_filter
+
+    @subject_filter.setter
+    def subject_filter(self, subject: str) -> None:
+        self.__subject_filter = subject
+
+    @url.setter
+    def url(self, URL: str) -> None:
+        self.__url = URL
+
+    @property
+    def results(self):
+        return self.__results
+
+    @property
+    def visited(self) -> Optional[VisitedSet]:
+        return self.__visited
+
+    async def __get_visited(self) -> VisitedSet:
+        if self.__visited is None:
+            self.__visited = await open_visited_set()
+        return self.__visited
+
+    async def asyncFetch(self, url: str, session: aiohttp.ClientSession, skip_recent: bool = True) -> Optional[Page]:
+        if not await (await self.__get_visited()).claim(url):
+            return None
+        if skip_recent and self.__recent is not None and await self.__recent.contains(url):
+            return None
+        return await self.__fetch(url, session)
+
+    async def __fetch(self, url: str, session: aiohttp.ClientSession) -> Optional[Page]:
+        html = None
+        async with self.__semaphore:
+            try:
+                response = await self.__cache.get_aiohttp(session, url, timeout=aiohttp.ClientTimeout(total=10))
+                if response.status == 200:
+                    html = response.text
+                    if self.__recent is not None and not response.from_cache:
+                        await self.__recent.add(url)
+                else:
+                    print(f"[!] Failed: {url} ({response.status})")
+            except Exception as e:
+                print(f"[!] Error fetching {url}: {type(e).__name__} - {e}")
+        if html is None:
+            return None
+        # parsarea se face în afara semaforului, ca slotul de conexiune să fie liber
+        return await self.__parse(url, html)
+
+    async def __parse(self, url: str, html: str) -> Page:
+        executor = self.__get_executor()
+        if executor is None:
+            return parse_page(url, html, self.__parser)
+
+        loop = asyncio.get_running_loop()
+        page = await loop.run_in_executor(executor, parse_page_lean, url, html, self.__parser)
+        page.html = html
+        return page
+
+    def __get_executor(self) -> Optional[Executor]:
+        if self.__executor is None and self.__parse_workers > 0:
+            # looked up per page, not kept: the shared pool is replaced when another crawler asks for more workers
+            return parse_pool(self.__parse_workers, processes=self.__parser not in GIL_RELEASING_PARSERS)
+        return self.__executor
+
+    async def close(self) -> None:
+        if self.__owns_visited and self.__visited is not None:
+            await self.__visited.close()
+            self.__visited = None
+
+    def is_valid(self, link: str) -> bool:
+        path = urlparse(link).path
+        return (
+            path.startswith("/wiki/")
+            and ":" not in path
+            and not path.startswith("/wiki/Main_Page")
+        )
+
+    def linkExtractor(self, page: Page) -> List[dict]:
+        return page.links
+
+    async def multi_crawler_async(self, url: str, depth: int = 0, max_depth: int = 1, tolerant_depth: int = 1, session=None, seed_page: Optional[Page] = None):
+        if depth > tolerant_depth or len(self.__results) >= self.__max_urls:
+            return
+
+        if session is None:
+            try:
+                await self.multi_crawler_async(url, depth, max_depth, tolerant_depth, session=self.__clients.session, seed_page=seed_page)
+            finally:
+                await self.close()
+            return
+
+        if not await (await self.__get_visited()).claim(url):
+            return
+
+        frontier = Frontier()
+        frontier.push(url, depth, 1.0)
+        budget_reached = asyncio.Event()
+        # pagina de start deja descărcată (de ex. la validare) nu se mai cere o dată
+        prefetched = {url: seed_page} if seed_page is not None else {}
+
+        async def worker():
+            while True:
+                page_url, page_depth = await frontier.pop()
+                try:
+                    await self.__crawl_one(page_url, page_depth, max_depth, tolerant_depth, session, frontier, budget_reached, prefetched.pop(page_url, None))
+                except Exception as e:
+                    print(f"[!] Error crawling {page_url}: {type(e).__name__} - {e}")
+                finally:
+                    frontier.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.__workers)]
+        drained = asyncio.create_task(frontier.join())
+        stop = asyncio.create_task(budget_reached.wait())
+        try:
+            await asyncio.wait([drained, stop], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # bugetul e atins sau frontiera e goală → oprim tot ce mai rulează
+            for task in workers + [drained, stop]:
+                task.cancel()
+            await asyncio.gather(*workers, drained, stop, return_exceptions=True)
+
+    async def __crawl_one(self, url: str, depth: int, max_depth: int, tolerant_depth: int, session: aiohttp.ClientSession, frontier: Frontier, budget_reached: asyncio.Event, page: Optional[Page] = None) -> None:
+        if budget_reached.is_set():
+            return
+
+        if page is None:
+            page = await self.__fetch(url, session)
+        if page is None or budget_reached.is_set():
+            return
+
+        if not page.mentions(self.__subject_filter):
+            return  # nu continuăm pe pagini irelevante
+
+        # pagina e relevantă → salvăm
+        self.__results.append(page.to_result())
+        if len(self.__results) >= self.__max_urls:
+            budget_reached.set()
+            return
+
+        if depth >= max_depth or depth + 1 > tolerant_depth:
+            return
+
+        scored = []
+        for link in self.linkExtractor(page):
+            if not self.is_valid(link.get("url", "")):
+                continue
+            score = relevance(self.__subject_filter, link["text"])  # extra filtru
+            if score >= self.__min_relevance:
+                scored.append((link["url"], score))
+        if not scored:
+            return
+
+        # un singur round trip pentru toate linkurile paginii
+        link_urls = [link_url for link_url, _ in scored]
+        if self.__recent is not None:
+            recent = await self.__recent.contains_many(link_urls)
+            scored = [item for item, seen in zip(scored, recent) if not seen]
+            link_urls = [link_url for link_url, _ in scored]
+        claimed = await (await self.__get_visited()).claim_many(link_urls)
+
+        for (link_url, score), is_new in zip(scored, claimed):
+            if is_new:
+                frontier.push(link_url, depth + 1, score)
+
+    async def fetchPage(self, url) -> None:
+        async with self.__semaphore:
+            try:
+                headers = {
+                          "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36"
+                        }
+
+                async with self.__clients.session.get(url, headers=headers) as response:
+                    if response.status == 200:   
+                        html = await response.text()
+
+                        soup = BeautifulSoup(html, "html.parser")
+                        filters = soup.find_all("div", class_="filter")
+                        for div in filters:
+                            print(div.text.strip())
+                        self.__results = filters
+            except Exception as e:
+                print(f'[!] Error fetching {url}: {type(e).__name__} - {e}')
+
+    def save_links_to_json(self, filename: str) -> None:
+        with open(filename, 'w', encoding="utf-8") as f:
+            json.dump(self.__results, f, indent=2, ensure_ascii=False)
@@ -1,19 +1,107 @@
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+import asyncio
 import json
+import re
+from typing import List, Optional
+from crawler.browserPool import BrowserPool
+from crawler.resourceProfile import LEAN_PROFILE, PageStats, ResourceProfile
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
 
+# A spec is {"container": css, "fields": {name: field}}; a field is either a css
+# selector whose text is read ("" = the container itself, "sel@attr" = an
+# attribute) or a nested spec, which yields a list of records.
+EXTRACT_SCRIPT = """
+(spec) => {
+    const read = (root, field) => {
+        if (typeof field === "string") {
+            const at = field.lastIndexOf("@");
+            const selector = (at >= 0 ? field.slice(0, at) : field).trim();
+            const el = selector ? root.querySelector(selector) : root;
+            if (!el) return null;
+            return at >= 0 ? el.getAttribute(field.slice(at + 1)) : el.textContent;
+        }
+        return Array.from(root.querySelectorAll(field.container), (el) => {
+            const record = {};
+            for (const [name, sub] of Object.entries(field.fields)) record[name] = read(el, sub);
+            return record;
+        });
+    };
+    return read(document, spec);
+}
+"""
+
+DEFAULT_SELECTORS = {
+    "products": {
+        "container": "div.card-item",
+        "fields": {"title": "a.card-v2-title", "price": "p.product-new-price"},
+    },
+    "filters": {
+        "container": "div.filter-default",
+        "fields": {
+            "category": "span",
+            "options": {"container": "a", "fields": {"label": "", "url": "@href"}},
+        },
+    },
+}
+
+
+def filters_from_records(records: List[dict]) -> List[dict]:
+    """Clean raw "filters" records into [{"category", "options": [{"label", "url"}]}]."""
+    extracted = []
+
+    for filter_div in records:
+        title = (filter_div["category"] or "").strip() or "Unknown"
+        options = []
+
+        for opt_el in filter_div["options"]:
+            text = opt_el["label"]
+            href = opt_el["url"]
+
+            if text and href:
+                cleaned = text.strip().replace('\n', ' ').strip()
+                if cleaned and cleaned != title:
+                    options.append({
+                        "label": cleaned,
+                        "url": href.strip()
+                    })
+
+
+        extracted.append({
+            "category": title,
+            "options": options
+        })
+    return extracted
+
+
+def products_from_records(records: List[dict]) -> List[dict]:
+    """Keep the "products" records that have both a title and a price."""
+    product_data = []
+    for p in records:
+        # custom specs may add fields, but need at least title and price
+        item = {name: value or "" for name, value in p.items()}
+
+        [product_data.append(item) if item['title'] != '' and item['price'] != ''  else print("Empty Produs")]
+        # product_data.append(item) -> numara si produsele goale
+    return product_data
+
+
 class DynamicScraping:
     """
     This class is responsible for dynamic scraping of web pages using Playwright.
     It includes methods to set up the browser, navigate to a URL, and extract content.
     """
 
-    def __init__(self, base_url=None, browser_type="chromium", headless=True, timeout=10000):
+    def __init__(self, base_url=None, browser_type="chromium", headless=True, timeout=10000, pool: Optional[BrowserPool] = None,
+                 profile: Optional[ResourceProfile] = LEAN_PROFILE):
         self.browser_type = browser_type
         self.headless = headless
         self.timeout = timeout
         self.base_url = base_url
+        # with a pool the page is borrowed from its warm browser instead of launching one,
+        # and the pool's profile applies instead of `profile` (None = load everything)
+        self.pool = pool
+        self.profile = profile
+        self.stats = PageStats()
 
         self.browser = None
         self.page = None
@@ -32,14 +120,30 @@ class DynamicScraping:
         await self.close()
 
     async def init_browser(self):
+        if self.pool is not None:
+            self.page = await self.pool.acquire()
+            self.page.set_default_timeout(self.timeout)
+            self.context = self.page.context
+            self.stats = self.pool.stats(self.page)
+            return
+        # imported here so HybridScraping's static path works without Playwright installed
+        from playwright.async_api import async_playwright
+
         self.playwright = await async_playwright().start()
         browser_launcher = getattr(self.playwright, self.browser_type)
         self.browser = await browser_launcher.launch(headless=self.headless)
-        self.context = await self.browser.new_context()
+        self.context = await self.browser.new_context(**(self.profile.context_options() if self.profile else {}))
         self.page = await self.context.new_page()
         self.page.set_default_timeout(self.timeout)
+        if self.profile:
+            self.stats = await self.profile.attach(self.page)
 
     async def close(self):
+        if self.pool is not None:
+            if self.page is not None:
+                await self.pool.release(self.page)
+                self.page = None
+            return
         if self.browser:
             await self.browser.close()
         if hasattr(self, "playwright"):
@@ -55,53 +159,34 @@ class DynamicScraping:
             print(f"[!] Navigation error: {e}")
 
     async def wait_for_selector(self, selector):
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         try:
-            await self.page.wait_for_selector(selector)
+            await self.page.wait_for_selector(selector, timeout=self.timeout)
         except PlaywrightTimeoutError:
             print(f"[!] Timeout waiting for selector: {selector}")
 
+    def selector_spec(self, name: str) -> dict:
+        """The spec set through set_custom_config, or the built-in eMAG one."""
+        return self.selectors.get(name) or DEFAULT_SELECTORS[name]
+
+    async def extract(self, spec: dict) -> list:
+        """
+        Run a selector spec inside the page and return all records from a single
+        evaluate() call, instead of one IPC round trip per element and field.
+        """
+        return await self.page.evaluate(EXTRACT_SCRIPT, spec)
+
     async def extract_elements(self, selector, attrs):
-        elements = await self.page.query_selector_all(selector)
-        for el in elements:
-            data = {}
-            for attr in attrs:
-                if attr == "text":
-                    data[attr] = (await el.text_content()) or ""
-                else:
-                    data[attr] = (await el.get_attribute(attr)) or ""
-            self.results.append(data)
+        fields = {attr: "" if attr == "text" else f"@{attr}" for attr in attrs}
+        for record in await self.extract({"container": selector, "fields": fields}):
+            self.results.append({attr: value or "" for attr, value in record.items()})
         return self.results
 
     async def extract_filters(self):
-        filter_container_selector = "div.filter-default"
-        await self.wait_for_selector(filter_container_selector)
-        filters = await self.page.query_selector_all(filter_container_selector)
-        extracted = []
-
-        for filter_div in filters:
-            title_el = await filter_div.query_selector("span")  
-            title = (await title_el.text_content()).strip() if title_el else "Unknown"
-
-            option_els = await filter_div.query_selector_all("a") 
-            options = []
-
-            for opt_el in option_els:
-                text = await opt_el.text_content()
-                href = await opt_el.get_attribute("href")
-                
-                if text and href:
-                    cleaned = text.strip().replace('\n', ' ').strip()
-                    if cleaned and cleaned != title:
-                        options.append({
-                            "label": cleaned,
-                            "url": href.strip()
-                        })
-
-
-            extracted.append({
-                "category": title,
-                "options": options
-            })
+        spec = self.selector_spec("filters")
+        await self.wait_for_selector(spec["container"])
+        extracted = filters_from_records(await self.extract(spec))
 
         self.filters = extracted
         return extracted
@@ -111,7 +196,8 @@ class DynamicScraping:
         
         filter_paths = []
         for f in filters:
-            url = f.get("url")
+            # {"label", "url"} dicts or FilterOption matches from a FilterCatalog
+            url = f.get("url") if isinstance(f, dict) else getattr(f, "url", None)
             if not isinstance(url, str):
                 continue
             parsed_filter_url = urlparse(url)
@@ -134,24 +220,61 @@ class DynamicScraping:
         return new_url
 
     async def extract_products(self):
-        product_selector = "div.card-item"
-        await self.wait_for_selector(product_selector)
-        products = await self.page.query_selector_all(product_selector)
-        product_data = []
-        for p in products:
-            title = await p.query_selector("a.card-v2-title")
-            price = await p.query_selector("p.product-new-price")
-            item = {
-                "title": await title.text_content() if title else "",
-                "price": await price.text_content() if price else "",
-            }
-
-            [product_data.append(item) if item['title'] != '' and item['price'] != ''  else print("Empty Produs")]
-            # product_data.append(item) -> numara si produsele goale
+        spec = self.selector_spec("products")
+        await self.wait_for_selector(spec["container"])
+        product_data = products_from_records(await self.extract(spec))
         self.results.extend(product_data)
         return product_data
 
+    @staticmethod
+    def page_urls(base_url: str, pages: int) -> List[str]:
+        """eMAG listing url for result pages 1..pages: .../laptopuri/c, .../laptopuri/p2/c, ..."""
+        path = re.sub(r"(/p\d+)?(/c)?/?$", "", base_url)
+        return [base_url] + [f"{path}/p{n}/c" for n in range(2, pages + 1)]
+
+    async def scrape_many(self, urls: List[str], products: bool = True, filters: bool = False) -> List[dict]:
+        """
+        Scrape several urls at once on pages borrowed from the pool (a private one
+        is started if this scraper has none); concurrency is the pool's max_pages.
+        Returns one {"url", "products", "filters", "stats", "error"} dict per url,
+        in order; a url that fails gets its error there without losing the others.
+        """
+        pool = self.pool or BrowserPool(self.browser_type, self.headless, timeout=self.timeout, profile=self.profile)
+
+        async def scrape(url):
+            scraper = DynamicScraping(base_url=url, timeout=self.timeout, pool=pool)
+            scraper.set_custom_config(self.selectors)
+            async with scraper:
+                return {
+                    "url": url,
+                    "products": await scraper.extract_products() if products else [],
+                    "filters": await scraper.extract_filters() if filters else [],
+                    "stats": scraper.stats.to_dict(),
+                    "error": None,
+                }
+
+        try:
+            outcomes = await asyncio.gather(*(scrape(url) for url in urls), return_exceptions=True)
+        finally:
+            if pool is not self.pool:
+                await pool.close()
+
+        pages = []
+        for url, outcome in zip(urls, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                print(f"[!] Scrape error for {url}: {type(outcome).__name__} - {outcome}")
+                outcome = {"url": url, "products": [], "filters": [], "stats": {}, "error": f"{type(outcome).__name__}: {outcome}"}
+            pages.append(outcome)
+        for page in pages:
+            self.results.extend(page["products"])
+            if page["filters"]:
+                self.filters = page["filters"]
+        return pages
+
     def set_custom_config(self, selectors: dict):
+        """Override DEFAULT_SELECTORS per key ("products", "filters") with specs of the same shape."""
         self.selectors = selectors
 
     def saveToJson(self, filter_file_name: str = "filter.json", product_file_name: str = "product.json", number_of_product: int = 10):
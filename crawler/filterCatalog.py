@@ -0,0 +1,167 @@
+import json
+import os
+import re
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
+from crawler.staticScraping import HybridScraping
+
+LABEL_COUNT = re.compile(r"^(?P<name>.*?)\s*\((?P<count>[\d.,]+)\)\s*$", re.S)
+TOKEN = re.compile(r"[a-z0-9]+")
+NUMBER_UNIT = re.compile(r"^(\d+)([a-z]+)$")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, without diacritics (ș -> s) or symbols (™, ®) and with whitespace collapsed."""
+    # symbols go first: NFKD would turn "Ryzen™" into "ryzentm"
+    text = "".join(" " if unicodedata.category(ch) == "So" else ch for ch in text)
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.lower().split())
+
+
+def parse_label(label: str):
+    """'Oferte                         (2)' -> ('Oferte', 2); labels without a count give None."""
+    label = " ".join(label.split())
+    match = LABEL_COUNT.match(label)
+    if match is None:
+        return label, None
+    return match.group("name"), int(re.sub(r"[.,]", "", match.group("count")))
+
+
+def tokenize(text: str) -> Set[str]:
+    """Search tokens; "16 GB" and "16GB" both give {"16", "gb", "16gb"}."""
+    words = TOKEN.findall(normalize(text))
+    tokens = set(words)
+    for word in words:
+        split = NUMBER_UNIT.match(word)
+        if split:
+            tokens.update(split.groups())
+    for number, unit in zip(words, words[1:]):
+        if number.isdigit() and unit.isalpha():
+            tokens.add(number + unit)
+    return tokens
+
+
+class FilterOption:
+
+    def __init__(self, category: str, label: str, url: str) -> None:
+        self.category = category
+        self.label = label
+        self.name, self.count = parse_label(label)
+        self.url = url
+        self.tokens = tokenize(self.name)
+
+    def to_dict(self) -> dict:
+        return {"category": self.category, "name": self.name, "count": self.count, "label": self.label, "url": self.url}
+
+
+class FilterCatalog:
+    """
+    The filter sidebar of one eMAG category, with labels split into name and
+    product count, and an inverted token index so a query such as "16 GB" or
+    "intel i7" is answered from set lookups instead of scanning every label.
+
+    A query matches an option when every query token is in the option name or
+    its category name, and at least one is in the option name.
+    """
+
+    def __init__(self, filters: List[dict]) -> None:
+        self.filters = filters
+        self.options: List[FilterOption] = []
+        self.index: Dict[str, Set[int]] = defaultdict(set)
+        self.category_index: Dict[str, Set[int]] = defaultdict(set)
+
+        for category in filters:
+            category_tokens = tokenize(category.get("category", ""))
+            for option in category.get("options", []):
+                if not option.get("label") or not option.get("url"):
+                    continue
+                position = len(self.options)
+                entry = FilterOption(category.get("category", ""), option["label"], option["url"])
+                self.options.append(entry)
+                for token in entry.tokens:
+                    self.index[token].add(position)
+                for token in category_tokens:
+                    self.category_index[token].add(position)
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def find(self, query: str, category: Optional[str] = None) -> List[FilterOption]:
+        """Options matching `query`, closest names first, then by product count."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        candidates = None
+        in_name: Set[int] = set()
+        for token in tokens:
+            found = self.index.get(token, set())
+            in_name |= found
+            found = found | self.category_index.get(token, set())
+            candidates = found if candidates is None else candidates & found
+        matches = [self.options[i] for i in candidates & in_name]
+        if category is not None:
+            matches = [option for option in matches if normalize(option.category) == normalize(category)]
+        return sorted(matches, key=lambda option: (len(option.tokens - tokens), -(option.count or 0)))
+
+    def select(self, queries: List[str], best_only: bool = False) -> List[FilterOption]:
+        """Matches for several queries, without duplicates; `best_only` keeps the top one per query."""
+        selected, seen = [], set()
+        for query in queries:
+            matches = self.find(query)
+            for option in matches[:1] if best_only else matches:
+                if option.url not in seen:
+                    seen.add(option.url)
+                    selected.append(option)
+        return selected
+
+
+def category_key(listing_url: str) -> str:
+    """'https://www.emag.ro/laptopuri/c' -> 'laptopuri'."""
+    parts = [part for part in urlparse(listing_url).path.split("/") if part and part != "c"]
+    return re.sub(r"[^a-z0-9_-]+", "_", "_".join(parts).lower()) or "root"
+
+
+class FilterCatalogStore:
+    """Filter sidebars saved per category as JSON, considered fresh for `ttl` seconds."""
+
+    def __init__(self, directory: str = "filter_cache", ttl: float = 24 * 60 * 60) -> None:
+        self.directory = directory
+        self.ttl = ttl
+
+    def path(self, category: str) -> str:
+        return os.path.join(self.directory, f"{category}.json")
+
+    def load(self, category: str) -> Optional[List[dict]]:
+        try:
+            with open(self.path(category), "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - stored.get("fetched_at", 0) > self.ttl:
+            return None
+        return stored.get("filters")
+
+    def save(self, category: str, filters: List[dict]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self.path(category) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "filters": filters}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.path(category))
+
+
+async def load_catalog(listing_url: str, store: Optional[FilterCatalogStore] = None, scraper: Optional[HybridScraping] = None,
+                       refresh: bool = False) -> FilterCatalog:
+    """The catalog for a listing url, re-scraping the sidebar only when the stored copy is stale."""
+    store = store or FilterCatalogStore()
+    category = category_key(listing_url)
+    filters = None if refresh else store.load(category)
+    if filters is None:
+        page = await (scraper or HybridScraping()).scrape(listing_url, products=False, filters=True)
+        filters = page["filters"]
+        if filters:
+            store.save(category, filters)
+    return FilterCatalog(filters)
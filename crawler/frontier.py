@@ -0,0 +1,41 @@
+import asyncio
+import itertools
+from typing import Tuple
+
+
+class Frontier:
+    """
+    Priority queue of urls waiting to be crawled. Shallower pages come first,
+    and among pages at the same depth the more relevant ones win.
+    """
+
+    def __init__(self) -> None:
+        self.__queue = asyncio.PriorityQueue()
+        self.__counter = itertools.count()
+
+    def push(self, url: str, depth: int, score: float = 0.0) -> None:
+        # the counter keeps equal priorities FIFO and avoids comparing urls
+        self.__queue.put_nowait((depth, -score, next(self.__counter), url))
+
+    async def pop(self) -> Tuple[str, int]:
+        depth, _, _, url = await self.__queue.get()
+        return url, depth
+
+    def task_done(self) -> None:
+        self.__queue.task_done()
+
+    async def join(self) -> None:
+        await self.__queue.join()
+
+    def __len__(self) -> int:
+        return self.__queue.qsize()
+
+
+def relevance(subject: str, text: str) -> float:
+    """1.0 when text contains the whole subject, else the share of subject words it contains."""
+    subject = subject.lower().strip()
+    text = text.lower()
+    if not subject or subject in text:
+        return 1.0
+    words = subject.split()
+    return sum(word in text for word in words) / len(words)
@@ -0,0 +1,169 @@
+from bs4 import BeautifulSoup
+from typing import Callable, Dict, List
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+
+WIKI_BASE = "https://en.wikipedia.org"
+LINK_BLACKLIST = ["portal", "template", "help", "category", "talk", "file", "main_page"]
+
+
+class Page:
+    """
+    Everything the crawler needs from one fetched page. Each fetch builds its own
+    Page, so concurrent crawl tasks never read each other's HTML.
+    """
+
+    def __init__(self, url: str, html: str, title: str, snippet: str, text: str, links: List[dict]) -> None:
+        self.url = url
+        self.html = html
+        self.title = title
+        self.snippet = snippet
+        self.text = text
+        self.links = links
+
+    def mentions(self, subject: str) -> bool:
+        return subject.lower() in self.text
+
+    def to_result(self) -> dict:
+        return {
+            "url": self.url,
+            "title": self.title,
+            "snippet": self.snippet,
+        }
+
+
+def keep_link(href: str, text: str) -> bool:
+    if not href.startswith("/wiki/"):
+        return False
+    if ":" in href:
+        return False
+    if any(bad in href.lower() for bad in LINK_BLACKLIST):
+        return False
+    if href == "#" or len(text) < 3:
+        return False
+    return True
+
+
+def extract_links(soup: BeautifulSoup) -> List[dict]:
+    links = []
+    for tg in soup.find_all("a", href=True):
+        href = tg["href"]
+        text = tg.get_text(strip=True)
+        if keep_link(href, text):
+            links.append({"text": text, "url": WIKI_BASE + href})
+    return links
+
+
+def _parse_selectolax(url: str, html: str) -> Page:
+    tree = HTMLParser(html)
+
+    title_node = tree.css_first("title")
+    paragraph = tree.css_first("p")
+    root = tree.body or tree.root
+
+    links = []
+    for a in tree.css('a[href^="/wiki/"]'):
+        href = a.attributes.get("href") or ""
+        text = a.text(strip=True)
+        if keep_link(href, text):
+            links.append({"text": text, "url": WIKI_BASE + href})
+
+    return Page(
+        url=url,
+        html=html,
+        title=title_node.text(strip=True) if title_node else "No title",
+        snippet=paragraph.text(strip=True) if paragraph else "",
+        text=root.text(separator=" ").lower() if root else "",
+        links=links,
+    )
+
+
+def _parse_lxml(url: str, html: str) -> Page:
+    doc = lxml_html.document_fromstring(html)
+
+    title = doc.findtext(".//title")
+    paragraph = doc.find(".//p")
+    body = doc.find("body")
+
+    links = []
+    for a in doc.xpath('//a[starts-with(@href, "/wiki/")]'):
+        href = a.get("href")
+        text = a.text_content().strip()
+        if keep_link(href, text):
+            links.append({"text": text, "url": WIKI_BASE + href})
+
+    return Page(
+        url=url,
+        html=html,
+        title=title.strip() if title else "No title",
+        snippet=paragraph.text_content().strip() if paragraph is not None else "",
+        text=(body if body is not None else doc).text_content().lower(),
+        links=links,
+    )
+
+
+def _parse_soup(url: str, html: str) -> Page:
+    soup = BeautifulSoup(html, "lxml" if lxml_html is not None else "html.parser")
+
+    title = soup.title.string if soup.title and soup.title.string else "No title"
+    first_paragraph = soup.find("p")
+    snippet = first_paragraph.get_text(strip=True) if first_paragraph else ""
+
+    return Page(
+        url=url,
+        html=html,
+        title=title,
+        snippet=snippet,
+        text=soup.get_text().lower(),
+        links=extract_links(soup),
+    )
+
+
+# lxml drops the GIL while building the tree, so a thread pool is enough for it
+GIL_RELEASING_PARSERS = {"lxml"}
+
+PARSERS: Dict[str, Callable[[str, str], Page]] = {
+    "selectolax": _parse_selectolax,
+    "lxml": _parse_lxml,
+    "bs4": _parse_soup,
+}
+
+
+def available_parsers() -> List[str]:
+    names = []
+    if HTMLParser is not None:
+        names.append("selectolax")
+    if lxml_html is not None:
+        names.append("lxml")
+    names.append("bs4")
+    return names
+
+
+def resolve_parser(name: str = "auto") -> str:
+    """Map "auto" (or a backend whose library is missing) to the fastest installed one."""
+    available = available_parsers()
+    if name in available:
+        return name
+    if name != "auto":
+        print(f"[!] Parser '{name}' is not installed, using '{available[0]}'")
+    return available[0]
+
+
+def parse_page(url: str, html: str, parser: str = "auto") -> Page:
+    return PARSERS[resolve_parser(parser)](url, html)
+
+
+def parse_page_lean(url: str, html: str, parser: str = "auto") -> Page:
+    """parse_page for worker processes: the html is not sent back, the caller still has it."""
+    page = parse_page(url, html, parser)
+    page.html = ""
+    return page
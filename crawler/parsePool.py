@@ -0,0 +1,41 @@
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict
+
+# one pool of each kind per process, shared by every Crawler, with the worker count it was created with
+_pools: Dict[str, Executor] = {}
+_sizes: Dict[str, int] = {}
+
+
+def _process_context():
+    # a fresh interpreter per worker instead of forking one that already runs
+    # asyncio, to_thread workers and sqlite connections
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def parse_pool(workers: int, processes: bool = True) -> Executor:
+    """
+    The shared executor for HTML parsing: processes for GIL-bound parsers, threads
+    otherwise. A request for more workers than the pool has replaces it with a
+    larger one; the old pool finishes the work already queued on it.
+    """
+    kind = "process" if processes else "thread"
+    pool = _pools.get(kind)
+    if pool is None or workers > _sizes[kind]:
+        if pool is not None:
+            pool.shutdown(wait=False)
+        if processes:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=_process_context())
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parse")
+        _pools[kind] = pool
+        _sizes[kind] = workers
+    return pool
+
+
+def close_parse_pools() -> None:
+    _sizes.clear()
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,114 @@
+import re
+from collections import Counter
+from contextlib import suppress
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+
+# ad, analytics and tracking hosts eMAG pages pull in; none of them affect the listing text
+BLOCKED_URL_PATTERNS = (
+    r"google-analytics\.com", r"googletagmanager\.com", r"googlesyndication\.com",
+    r"doubleclick\.net", r"googleadservices\.com", r"facebook\.(net|com)/", r"connect\.facebook",
+    r"hotjar\.com", r"criteo\.(com|net)", r"tiktok\.com", r"bing\.com/", r"clarity\.ms",
+    r"cloudflareinsights\.com", r"/collect\?", r"/beacon", r"/pixel",
+)
+
+# on the site's own host a pattern only blocks these; pages and their scripts always load
+FIRST_PARTY_PATTERN_TYPES = {"xhr", "fetch", "image", "ping"}
+
+
+def site_of(url: str) -> str:
+    """Registrable-domain approximation: the last two labels of the host."""
+    return ".".join((urlparse(url).hostname or "").split(".")[-2:])
+
+
+class PageStats:
+    """What a page loaded and what the profile kept it from loading."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.bytes = 0
+        self.blocked = 0
+        self.blocked_by_type: Counter = Counter()
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "blocked": self.blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+
+class ResourceProfile:
+    """
+    Request interception applied to every page DynamicScraping or BrowserPool
+    opens. Requests are aborted by resource type ("image", "font", "stylesheet",
+    "media", ...) or when their url matches one of `block_patterns`. Documents
+    and navigations are never blocked, and on the page's own site a pattern
+    only applies to xhr/fetch/image/ping requests.
+
+    `images=False` blocks images and media. `javascript=False` turns page
+    scripts off for server-rendered targets; extraction through page.evaluate
+    still works because it doesn't run as a page script.
+    """
+
+    def __init__(self, block_types: Iterable[str] = ("font", "stylesheet"), block_patterns: Iterable[str] = BLOCKED_URL_PATTERNS,
+                 images: bool = False, javascript: bool = True) -> None:
+        self.block_types = set(block_types)
+        if not images:
+            self.block_types |= {"image", "media"}
+        patterns = list(block_patterns)
+        self.pattern: Optional[re.Pattern] = re.compile("|".join(patterns), re.IGNORECASE) if patterns else None
+        self.images = images
+        self.javascript = javascript
+
+    def context_options(self) -> dict:
+        return {"java_script_enabled": self.javascript}
+
+    def blocks(self, resource_type: str, url: str, site: str = "", navigation: bool = False) -> bool:
+        """Whether to abort a request; `site` is the page's own site as given by site_of()."""
+        if navigation or resource_type == "document":
+            return False
+        if resource_type in self.block_types:
+            return True
+        if self.pattern is None or self.pattern.search(url) is None:
+            return False
+        return site_of(url) != site or resource_type in FIRST_PARTY_PATTERN_TYPES
+
+    async def attach(self, page) -> PageStats:
+        """Install the interception on `page` and return the counters it updates."""
+        stats = PageStats()
+        site = {"current": ""}
+
+        async def route(route):
+            request = route.request
+            navigation = request.is_navigation_request()
+            if navigation:
+                with suppress(Exception):  # service worker requests have no frame
+                    if request.frame == page.main_frame:
+                        site["current"] = site_of(request.url)
+            if self.blocks(request.resource_type, request.url, site["current"], navigation):
+                stats.blocked += 1
+                stats.blocked_by_type[request.resource_type] += 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        async def finished(request):
+            stats.requests += 1
+            with suppress(Exception):  # the page may already be gone
+                sizes = await request.sizes()
+                stats.bytes += sizes["responseBodySize"] + sizes["responseHeadersSize"]
+
+        if self.block_types or self.pattern is not None:
+            await page.route("**/*", route)
+        page.on("requestfinished", finished)
+        return stats
+
+
+# what DynamicScraping uses unless told otherwise: only documents, scripts and XHR get through
+LEAN_PROFILE = ResourceProfile()
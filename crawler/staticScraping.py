@@ -0,0 +1,108 @@
+import asyncio
+from typing import List, Optional
+from bs4 import BeautifulSoup
+from crawler.browserPool import BrowserPool, default_pool
+from crawler.cache import HttpCache, default_cache
+from crawler.client import HttpClients, default_clients
+from crawler.dynamicScraping import DEFAULT_SELECTORS, DynamicScraping, filters_from_records, products_from_records
+from crawler.page import lxml_html
+
+# eMAG serves a stripped page to clients that don't look like a browser
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept-Language": "ro-RO,ro;q=0.9,en;q=0.8",
+}
+
+
+def extract_static(root, spec: dict) -> List[dict]:
+    """The EXTRACT_SCRIPT selector spec applied to parsed HTML instead of a live page."""
+    records = []
+    for el in root.select(spec["container"]):
+        record = {}
+        for name, field in spec["fields"].items():
+            if isinstance(field, dict):
+                record[name] = extract_static(el, field)
+                continue
+            selector, _, attr = field.rpartition("@") if "@" in field else (field, "", "")
+            target = el.select_one(selector.strip()) if selector.strip() else el
+            if target is None:
+                record[name] = None
+            elif attr:
+                record[name] = target.get(attr)
+            else:
+                record[name] = target.get_text()
+        records.append(record)
+    return records
+
+
+class HybridScraping:
+    """
+    Scrapes eMAG listing pages over plain HTTP first and parses the card-item and
+    filter-default blocks from the server HTML with the same selector specs as
+    DynamicScraping. The browser (through the shared BrowserPool) is only used
+    for a url whose static parse comes back empty or incomplete.
+    """
+
+    def __init__(self, selectors: Optional[dict] = None, clients: Optional[HttpClients] = None, cache: Optional[HttpCache] = None,
+                 pool: Optional[BrowserPool] = None, min_complete: float = 0.5) -> None:
+        self.selectors = selectors or {}
+        self.clients = clients
+        self.cache = cache
+        self.pool = pool
+        # share of product cards that must have both title and price for the static parse to count
+        self.min_complete = min_complete
+        self.static_hits = 0
+        self.browser_fallbacks = 0
+
+    def selector_spec(self, name: str) -> dict:
+        return self.selectors.get(name) or DEFAULT_SELECTORS[name]
+
+    async def fetch_html(self, url: str) -> Optional[str]:
+        clients = self.clients or default_clients()
+        cache = self.cache or default_cache()
+        try:
+            res = await cache.get_httpx(clients.httpx, url, headers=HEADERS, follow_redirects=True)
+        except Exception as e:
+            print(f"[!] Static fetch error for {url}: {e}")
+            return None
+        return res.text if res.status == 200 else None
+
+    async def scrape_static(self, url: str, products: bool = True, filters: bool = False) -> Optional[dict]:
+        """The page parsed from its server HTML, or None when the browser is needed."""
+        html = await self.fetch_html(url)
+        if html is None:
+            return None
+        soup = await asyncio.to_thread(BeautifulSoup, html, "lxml" if lxml_html is not None else "html.parser")
+        page = {"url": url, "products": [], "filters": [], "source": "static", "error": None}
+
+        if products:
+            cards = extract_static(soup, self.selector_spec("products"))
+            page["products"] = products_from_records(cards)
+            if not cards or len(page["products"]) < len(cards) * self.min_complete:
+                return None
+        if filters:
+            page["filters"] = filters_from_records(extract_static(soup, self.selector_spec("filters")))
+            if not any(category["options"] for category in page["filters"]):
+                return None
+        return page
+
+    async def scrape_many(self, urls: List[str], products: bool = True, filters: bool = False) -> List[dict]:
+        """
+        One {"url", "products", "filters", "source"} dict per url, in order; source is
+        "static" or "browser", and "error" is set for a url that failed in the browser.
+        """
+        pages = list(await asyncio.gather(*(self.scrape_static(url, products, filters) for url in urls)))
+        missing = [i for i, page in enumerate(pages) if page is None]
+        self.static_hits += len(urls) - len(missing)
+
+        if missing:
+            self.browser_fallbacks += len(missing)
+            scraper = DynamicScraping(pool=self.pool or default_pool())
+            scraper.set_custom_config(self.selectors)
+            scraped = await scraper.scrape_many([urls[i] for i in missing], products, filters)
+            for i, page in zip(missing, scraped):
+                pages[i] = {**page, "source": "browser"}
+        return pages
+
+    async def scrape(self, url: str, products: bool = True, filters: bool = False) -> dict:
+        return (await self.scrape_many([url], products, filters))[0]
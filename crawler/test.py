@@ -1,5 +1,9 @@
-from __init__ import Crawler
-from dynamicScraping import DynamicScraping
+from crawler import Crawler
+from crawler.dynamicScraping import DynamicScraping
+from crawler.staticScraping import HybridScraping
+from crawler.filterCatalog import FilterCatalog, load_catalog
+from crawler.browserPool import close_default_pool
+from crawler.client import default_clients
 import asyncio
 import json
 
@@ -9,34 +13,45 @@ async def mainCrawler():
     crawler.save_links_to_json("test.json")
 
 async def dynamicScraping():
-    async with DynamicScraping(base_url="https://www.emag.ro/laptopuri/") as scraper:
-        filters = await scraper.extract_filters()
+    # plain HTTP first; the browser is only started for pages the server doesn't render
+    hybrid = HybridScraping()
+    try:
+        # the sidebar is only re-scraped when the stored copy for this category is stale
+        catalog = await load_catalog("https://www.emag.ro/laptopuri/", scraper=hybrid)
 
         target_labels = ["amd ryzen", "4 GB"]
 
-        with open("filter.json", "r", encoding="utf-8") as f:
-            json_filters = json.load(f)
-
-        results = []
-
-        for category in json_filters:
-            for option in category.get("options", []):
-                label = option.get("label", "").strip()
-                if any(target.lower() in label.lower() for target in target_labels):
-                    results.append({
-                        "label": label,
-                        "url": option.get("url")
-                    })
+        results = catalog.select(target_labels)
+        for option in results:
+            print(f"{option.category}: {option.name} ({option.count})")
 
+        scraper = DynamicScraping()
         combined_url = scraper.build_filters("https://www.emag.ro/laptopuri", results)
         print("URL cu filtre combinate:", combined_url)
 
-        scraper.base_url = combined_url
-        await scraper.extract_products()
+        page = await hybrid.scrape(combined_url)
+        scraper.filters = catalog.filters
+        scraper.results = page["products"]
 
         scraper.saveToJson()
+        print("Page stats:", page.get("stats", "static fetch"))
+        print(f"Static pages: {hybrid.static_hits}, browser fallbacks: {hybrid.browser_fallbacks}")
+    finally:
+        await close_default_pool()
+        await default_clients().close()
+
+
+def checkFilterCatalog(path: str = "filter.json"):
+    # the saved eMAG sidebar has labels like "AMD Ryzen™ 5   (553)"; every target must still resolve
+    with open(path, "r", encoding="utf-8") as f:
+        catalog = FilterCatalog(json.load(f))
+    for target in ["amd ryzen", "4 GB", "intel core i7"]:
+        matches = catalog.find(target)
+        assert matches, f"no filter matches {target!r}"
+        print(target, "->", [option.name for option in matches])
 
 
 if __name__ == "__main__":
     # asyncio.run(mainCrawler())
+    # checkFilterCatalog()
     asyncio.run(dynamicScraping())
@@ -0,0 +1,199 @@
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+
+class VisitedSet(ABC):
+    """
+    Interface for the crawler's set of already visited URLs. All methods are
+    coroutines so a network backend never blocks the event loop.
+    """
+
+    @abstractmethod
+    async def claim(self, url: str) -> bool:
+        """Mark url as visited. Returns False if it already was."""
+        raise NotImplementedError
+
+    async def claim_many(self, urls: List[str]) -> List[bool]:
+        return [await self.claim(url) for url in urls]
+
+    @abstractmethod
+    async def contains_many(self, urls: List[str]) -> List[bool]:
+        raise NotImplementedError
+
+    async def contains(self, url: str) -> bool:
+        return (await self.contains_many([url]))[0]
+
+    async def add(self, url: str) -> None:
+        await self.claim(url)
+
+    @abstractmethod
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryVisitedSet(VisitedSet):
+
+    def __init__(self, urls: Iterable[str] = ()) -> None:
+        self.__urls = set(urls)
+
+    async def claim(self, url: str) -> bool:
+        if url in self.__urls:
+            return False
+        self.__urls.add(url)
+        return True
+
+    async def contains_many(self, urls: List[str]) -> List[bool]:
+        return [url in self.__urls for url in urls]
+
+    async def clear(self) -> None:
+        self.__urls.clear()
+
+
+class RedisVisitedSet(VisitedSet):
+    """
+    Visited set stored under its own key, crawler:visited:<crawl id>, so
+    concurrent crawls never share or wipe each other's state. The key expires
+    after ttl seconds in case a crawl dies before close() deletes it.
+    """
+
+    def __init__(self, key: str = None, ttl: int = 3600, host: str = "localhost", port: int = 6379, db: int = 0, client: aioredis.Redis = None) -> None:
+        self.__key = key or f"crawler:visited:{uuid.uuid4().hex}"
+        self.__ttl = ttl
+        self.__redis = client or aioredis.Redis(host=host, port=port, db=db)
+
+    @property
+    def key(self) -> str:
+        return self.__key
+
+    async def claim(self, url: str) -> bool:
+        # SADD is atomic, so two tasks racing for the same url can't both win
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(self.__key, url)
+            pipe.expire(self.__key, self.__ttl)
+            added, _ = await pipe.execute()
+        return added == 1
+
+    async def claim_many(self, urls: List[str]) -> List[bool]:
+        if not urls:
+            return []
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            for url in urls:
+                pipe.sadd(self.__key, url)
+            pipe.expire(self.__key, self.__ttl)
+            replies = await pipe.execute()
+        return [added == 1 for added in replies[:-1]]
+
+    async def contains_many(self, urls: List[str]) -> List[bool]:
+        if not urls:
+            return []
+        flags = await self.__redis.smismember(self.__key, urls)
+        return [bool(flag) for flag in flags]
+
+    async def clear(self) -> None:
+        await self.__redis.delete(self.__key)
+
+    async def close(self) -> None:
+        try:
+            await self.clear()
+        except (RedisError, OSError) as e:
+            # the key expires after ttl anyway; don't hide the error that ended the crawl
+            print(f"[!] Could not delete {self.__key}: {e}")
+        finally:
+            await self.__redis.aclose()
+
+
+class MemoryRecentSet(VisitedSet):
+    """
+    Urls fetched in the last `window` seconds. Meant to be shared between
+    crawls in one process so they skip pages another crawl just fetched.
+    """
+
+    def __init__(self, window: int = 600) -> None:
+        self.__window = window
+        self.__fetched: Dict[str, float] = {}
+
+    def __is_recent(self, url: str, now: float) -> bool:
+        fetched_at = self.__fetched.get(url)
+        return fetched_at is not None and now - fetched_at < self.__window
+
+    async def claim(self, url: str) -> bool:
+        now = time.time()
+        if self.__is_recent(url, now):
+            return False
+        self.__fetched[url] = now
+        return True
+
+    async def add(self, url: str) -> None:
+        self.__fetched[url] = time.time()
+
+    async def contains_many(self, urls: List[str]) -> List[bool]:
+        now = time.time()
+        return [self.__is_recent(url, now) for url in urls]
+
+    async def clear(self) -> None:
+        self.__fetched.clear()
+
+
+class RedisRecentSet(VisitedSet):
+    """
+    Long-lived sorted set (url -> fetch time) shared by every crawl. Entries
+    older than `window` seconds are ignored and trimmed on write.
+    """
+
+    def __init__(self, key: str = "crawler:recently_fetched", window: int = 600, host: str = "localhost", port: int = 6379, db: int = 0, client: aioredis.Redis = None) -> None:
+        self.__key = key
+        self.__window = window
+        self.__redis = client or aioredis.Redis(host=host, port=port, db=db)
+
+    @property
+    def key(self) -> str:
+        return self.__key
+
+    async def claim(self, url: str) -> bool:
+        if await self.contains(url):
+            return False
+        await self.add(url)
+        return True
+
+    async def add(self, url: str) -> None:
+        now = time.time()
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(self.__key, {url: now})
+            pipe.zremrangebyscore(self.__key, "-inf", now - self.__window)
+            pipe.expire(self.__key, self.__window)
+            await pipe.execute()
+
+    async def contains_many(self, urls: List[str]) -> List[bool]:
+        if not urls:
+            return []
+        cutoff = time.time() - self.__window
+        scores = await self.__redis.zmscore(self.__key, urls)
+        return [score is not None and score >= cutoff for score in scores]
+
+    async def clear(self) -> None:
+        await self.__redis.delete(self.__key)
+
+    async def close(self) -> None:
+        await self.__redis.aclose()
+
+
+async def open_visited_set(ttl: int = 3600, host: str = "localhost", port: int = 6379, db: int = 0) -> VisitedSet:
+    """
+    A RedisVisitedSet when Redis answers, otherwise a MemoryVisitedSet, which is
+    all a crawl running in a single process needs.
+    """
+    client = aioredis.Redis(host=host, port=port, db=db, socket_connect_timeout=1)
+    try:
+        await client.ping()
+    except (RedisError, OSError) as e:
+        print(f"[!] Redis unavailable ({e}), using an in-memory visited set")
+        await client.aclose()
+        return MemoryVisitedSet()
+    return RedisVisitedSet(ttl=ttl, client=client)
@@ -0,0 +1,146 @@
+import asyncio
+import json
+from typing import Dict, List, Optional
+from urllib.parse import unquote, urlparse
+import aiohttp
+from crawler.page import Page, WIKI_BASE, keep_link
+from crawler.frontier import relevance
+from crawler.visited import VisitedSet, MemoryVisitedSet
+from crawler.client import HttpClients, default_clients
+
+
+API_URL = "https://en.wikipedia.org/w/api.php"
+TITLES_PER_REQUEST = 50
+
+
+def title_from_url(url: str) -> str:
+    return unquote(urlparse(url).path.split("/wiki/", 1)[-1]).replace("_", " ")
+
+
+def url_from_title(title: str) -> str:
+    return f"{WIKI_BASE}/wiki/{title.replace(' ', '_')}"
+
+
+class WikipediaApiCrawler:
+    """
+    Subject crawl over the MediaWiki API instead of rendered article HTML.
+    Asks for intro extracts and article links of up to 50 titles per request and
+    produces the same {url, title, snippet} records as Crawler.
+    """
+
+    def __init__(self, URL: str = "", subject: str = "", max_urls: int = 50, concurrency: int = 5, visited: Optional[VisitedSet] = None, min_relevance: float = 1.0, clients: Optional[HttpClients] = None) -> None:
+        self.__url = URL
+        self.__subject_filter = subject
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__results = []
+        self.__max_urls = max_urls
+        self.__min_relevance = min_relevance
+        self.__visited = visited if visited is not None else MemoryVisitedSet()
+        self.__clients = clients if clients is not None else default_clients()
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def results(self):
+        return self.__results
+
+    async def fetchPages(self, titles: List[str], session: aiohttp.ClientSession, with_links: bool = True) -> List[Page]:
+        """Extracts for `titles`; their links too when `with_links` is set (they cost many continuation requests)."""
+        params = {
+            "action": "query",
+            "prop": "extracts|links" if with_links else "extracts",
+            "titles": "|".join(titles),
+            "exintro": 1,
+            "explaintext": 1,
+            "exlimit": "max",
+            "redirects": 1,
+            "format": "json",
+            "formatversion": 2,
+        }
+        if with_links:
+            params.update({"plnamespace": 0, "pllimit": "max"})
+        pages: Dict[str, dict] = {}
+
+        async with self.__semaphore:
+            try:
+                while True:
+                    async with session.get(API_URL, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                        if response.status != 200:
+                            print(f"[!] Failed: {API_URL} ({response.status})")
+                            break
+                        data = await response.json()
+
+                    for item in data.get("query", {}).get("pages", []):
+                        if item.get("missing"):
+                            continue
+                        page = pages.setdefault(item["title"], {"extract": "", "links": []})
+                        page["extract"] = page["extract"] or item.get("extract", "")
+                        page["links"].extend(link["title"] for link in item.get("links", []))
+
+                    # extracts and links page through the same continue block
+                    if "continue" not in data:
+                        break
+                    params.update(data["continue"])
+            except Exception as e:
+                print(f"[!] Error fetching {API_URL}: {type(e).__name__} - {e}")
+
+        return [self.__to_page(title, page) for title, page in pages.items()]
+
+    def __to_page(self, title: str, page: dict) -> Page:
+        extract = page["extract"]
+        links = []
+        for link_title in page["links"]:
+            href = "/wiki/" + link_title.replace(" ", "_")
+            if keep_link(href, link_title):
+                links.append({"text": link_title, "url": WIKI_BASE + href})
+
+        return Page(
+            url=url_from_title(title),
+            html="",
+            title=title,
+            snippet=extract.split("\n", 1)[0].strip(),
+            text=f"{title}\n{extract}".lower(),
+            links=links,
+        )
+
+    async def multi_crawler_async(self, url: str, depth: int = 0, max_depth: int = 1, tolerant_depth: int = 1, session=None):
+        if session is None:
+            await self.multi_crawler_async(url, depth, max_depth, tolerant_depth, session=self.__clients.session)
+            return
+
+        if not await self.__visited.claim(url):
+            return
+
+        last_depth = min(max_depth, tolerant_depth)
+        level = [title_from_url(url)]
+        while level and depth <= last_depth:
+            # links are only needed for a level that will be expanded
+            expand = depth < last_depth
+            batches = [level[i:i + TITLES_PER_REQUEST] for i in range(0, len(level), TITLES_PER_REQUEST)]
+            fetched = await asyncio.gather(*(self.fetchPages(batch, session, with_links=expand) for batch in batches))
+
+            next_links = []
+            for page in (page for pages in fetched for page in pages):
+                if len(self.__results) >= self.__max_urls:
+                    return
+                if not page.mentions(self.__subject_filter):
+                    continue
+                self.__results.append(page.to_result())
+                if expand:
+                    next_links.extend(
+                        link for link in page.links
+                        if relevance(self.__subject_filter, link["text"]) >= self.__min_relevance
+                    )
+
+            if not expand or len(self.__results) >= self.__max_urls:
+                return
+
+            claimed = await self.__visited.claim_many([link["url"] for link in next_links])
+            level = [link["text"] for link, is_new in zip(next_links, claimed) if is_new]
+            depth += 1
+
+    def save_links_to_json(self, filename: str) -> None:
+        with open(filename, 'w', encoding="utf-8") as f:
+            json.dump(self.__results, f, indent=2, ensure_ascii=False)
@@ -1,17 +1,52 @@
+import time
+STARTED = time.perf_counter()
+
 from agent.agent import AIAgent
+from crawler.client import HttpClients
+from crawler.browserPool import close_default_pool
+from crawler.parsePool import close_parse_pools
 from dotenv import load_dotenv
+import argparse
 import os
 import asyncio
 
-async def main():
+async def main(args):
     API_LM_KEY = os.getenv("API_LM_KEY")
     print(API_LM_KEY)
-    agent = AIAgent(API_LM_KEY)
-    
-    await agent.chat()
+    async with HttpClients() as clients:
+        try:
+            if args.serve:
+                from agent.server import AgentServer
+                server = AgentServer(API_LM_KEY, clients, max_sessions=args.max_sessions)
+                await server.serve(args.host, args.port)
+            else:
+                agent = AIAgent(API_LM_KEY, clients=clients)
+                await agent.chat()
+        finally:
+            # the scraping tool keeps its browser warm and crawls share one parse pool
+            await close_default_pool()
+            close_parse_pools()
+
+def startup_report():
+    from agent.tool import import_report
+    print(f"startup imports: {(time.perf_counter() - STARTED) * 1000:.0f} ms")
+    for name, seconds in import_report().items():
+        if isinstance(seconds, str):
+            print(f"  {name}: {seconds}")
+        else:
+            print(f"  {name}: {seconds * 1000:.0f} ms on first use")
 
 if __name__ == "__main__":
     load_dotenv()
-    asyncio.run(main())
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--serve", action="store_true", help="run the multi-session HTTP server instead of the CLI")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-sessions", type=int, default=100)
+    parser.add_argument("--startup-report", action="store_true", help="print import times for startup and each tool, then exit")
+    args = parser.parse_args()
+    if args.startup_report:
+        startup_report()
+    else:
+        asyncio.run(main(args))
 
-    
\ No newline at end of file